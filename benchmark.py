@@ -0,0 +1,530 @@
+"""
+Benchmarks for the site generator
+Run this to time every stage of the build on synthetic content scaled 1x,
+10x and 100x (or --scales), and to compare format_text against the previous regex
+implementation. Everything runs locally; results are written as JSON.
+"""
+
+from contextlib import contextmanager, redirect_stdout
+import argparse
+import copy
+import dataclasses
+import io
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+from fasthtml.common import *
+
+import generate_site
+from generate_site import CONTENT, FORMAT_CACHE, format_many, format_text
+
+
+def format_text_regex(text):
+    """The previous regex-based format_text, kept as the benchmark baseline"""
+    if not text or not isinstance(text, str):
+        return [text] if text else []
+
+    pattern = r'(_\*/[^/]+/\*_|_/\*[^*]+\*/_|\*_/[^/]+/_\*|\*/_[^_]+_/\*|/_\*[^*]+\*_/|/\*_[^_]+_\*/|_\*[^*]+\*_|\*_[^_]+_\*|/_[^_]+_/|/\*[^*]+\*/|_/[^/]+/_|\*/[^/]+/\*|_[^_]+_|\*[^*]+\*|/[^/]+/)'
+    parts = re.split(pattern, text)
+
+    # (opening markers, wrappers outermost first), longest markers first
+    forms = [
+        ('_*/', (Em, Strong, U)), ('_/*', (Em, U, Strong)), ('*_/', (Strong, Em, U)),
+        ('*/_', (Strong, U, Em)), ('/_*', (U, Em, Strong)), ('/*_', (U, Strong, Em)),
+        ('_*', (Em, Strong)), ('*_', (Strong, Em)), ('/_', (U, Em)),
+        ('/*', (U, Strong)), ('_/', (Em, U)), ('*/', (Strong, U)),
+        ('_', (Em,)), ('*', (Strong,)), ('/', (U,)),
+    ]
+    result = []
+    for part in parts:
+        if not part:
+            continue
+        for opening, wrappers in forms:
+            if part.startswith(opening) and part.endswith(opening[::-1]):
+                node = part[len(opening):-len(opening)]
+                for wrap in reversed(wrappers):
+                    node = wrap(node)
+                result.append(node)
+                break
+        else:
+            result.append(part)
+    return result
+
+
+def create_style_fstring(theme):
+    """The previous f-string create_style body, kept as the theme benchmark baseline"""
+    return f"""
+        :root[data-theme="light"] {{
+            --bg-color: {theme['bg_light']};
+            --bg-secondary: {theme['bg_light']};
+            --text-color: #1a1a1a;
+            --text-secondary: #666666;
+            --border-color: #e0e0e0;
+            --accent-color: {theme['accent_light']};
+            --accent-hover: {theme['accent_light']};
+            --card-bg: #ffffff;
+            --card-border: #e5e7eb;
+        }}
+
+        :root[data-theme="dark"] {{
+            --bg-color: {theme['bg_dark']};
+            --bg-secondary: {theme['bg_secondary_dark']};
+            --text-color: #f0f0f0;
+            --text-secondary: #a0a0a0;
+            --border-color: #333333;
+            --accent-color: {theme['accent_dark']};
+            --accent-hover: {theme['accent_hover_dark']};
+            --card-bg: {theme['bg_secondary_dark']};
+            --card-border: #2a2a2a;
+        }}
+    """
+
+
+def long_paragraph(words=2000, seed=0):
+    """A long paragraph built from the About text with formatting sprinkled in"""
+    rng = random.Random(seed)
+    vocab = " ".join(CONTENT["about"].paragraphs).replace("_", "").replace("*", "").replace("/", "").split()
+    out = []
+    for _ in range(words):
+        word = rng.choice(vocab)
+        roll = rng.random()
+        if roll < 0.05:
+            word = f"*{word}*"
+        elif roll < 0.08:
+            word = f"_{word}_"
+        elif roll < 0.10:
+            word = f"/_*{word}*_/"
+        out.append(word)
+    return " ".join(out)
+
+
+def slashy_paragraph(urls=500):
+    """A paragraph full of URLs and paths, where most slashes never pair up cleanly"""
+    return " ".join(
+        f"see https://example.com/docs/{i}/index.html and/or src/pkg_{i}/mod.py"
+        for i in range(urls)
+    )
+
+
+def bench(label, text, number=20):
+    """Time both implementations on text and print the results"""
+    regex = min(timeit.repeat(lambda: format_text_regex(text), number=number, repeat=3)) / number
+    # Clear the memo cache first so every call measures a cold parse
+    scanner = min(timeit.repeat(lambda: (FORMAT_CACHE.clear(), format_text(text)), number=number, repeat=3)) / number
+    print(f"{label:<28} {len(text):>8} chars  regex {regex * 1e3:8.3f} ms  "
+          f"scanner {scanner * 1e3:8.3f} ms  ({regex / scanner:5.2f}x)")
+
+
+def bench_batch(label, paragraphs, number=5):
+    """Time format_many against calling format_text once per paragraph"""
+    each = min(timeit.repeat(lambda: (FORMAT_CACHE.clear(), [format_text(p) for p in paragraphs]),
+                             number=number, repeat=3)) / number
+    batch = min(timeit.repeat(lambda: (FORMAT_CACHE.clear(), format_many(paragraphs)),
+                              number=number, repeat=3)) / number
+    print(f"{label:<28} {len(paragraphs):>8} paras  per-call {each * 1e3:8.3f} ms  "
+          f"format_many {batch * 1e3:8.3f} ms  ({each / batch:5.2f}x)")
+
+
+def bench_themes(count, number=20):
+    """Time filling the theme template against the f-string, including validation"""
+    themes = list(synthetic_themes(count).values())
+    fstring = min(timeit.repeat(lambda: [create_style_fstring(t) for t in themes], number=number, repeat=3)) / number
+    validate = min(timeit.repeat(lambda: generate_site.validate_themes(dict(enumerate(themes))),
+                                 number=number, repeat=3)) / number
+    render = generate_site.THEME_STYLE.render
+    compiled = min(timeit.repeat(lambda: [render(t) for t in themes], number=number, repeat=3)) / number
+    print(f"{count:>6} themes  f-string {fstring * 1e3:8.3f} ms  template {compiled * 1e3:8.3f} ms  "
+          f"({compiled / count * 1e6:.2f} µs per theme), validation {validate * 1e3:8.3f} ms")
+
+
+def bench_fragments(counts=(1, 10, 100, 500)):
+    """
+    Time rendering every theme page as the theme count grows, rebuilding the
+    theme-independent fragments for every page (as before) and building them
+    once and splicing the cached strings in
+    """
+    for count in counts:
+        themes = synthetic_themes(count)
+        with using(CONTENT, themes), scratch_store():
+            def per_page():
+                for key in themes:
+                    generate_site.FRAGMENT_CACHE.clear()
+                    generate_site.render_page(key)
+
+            def spliced():
+                generate_site.FRAGMENT_CACHE.clear()
+                for key in themes:
+                    generate_site.render_page(key)
+
+            rebuilt = min(timeit.repeat(per_page, number=1, repeat=3))
+            cached = min(timeit.repeat(spliced, number=1, repeat=3))
+        print(f"{count:>6} themes  rebuilt per page {rebuilt * 1e3:9.2f} ms  spliced {cached * 1e3:9.2f} ms  "
+              f"({rebuilt / cached:5.2f}x, {cached / count * 1e3:.3f} ms per page)")
+
+
+def bench_fragment_store(experience=100):
+    """
+    Time a cold build, a warm build and a build after editing one bullet,
+    each rendering every page, with experience times the jobs
+    """
+    content = synthetic_content(experience=experience)
+    first = content["experience"][0]
+    edited = dict(content, experience=(
+        dataclasses.replace(first, bullets=(f"{first.bullets[0]} (edited)", *first.bullets[1:])),
+        *content["experience"][1:],
+    ))
+    cwd = os.getcwd()
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            for label, data in (("cold", content), ("warm", content), ("one bullet edited", edited)):
+                with using(data, BASE_THEMES), redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    generate_site.build(force=True)
+                    timings[label] = time.perf_counter() - start
+                print(f"{len(content['experience']):>6} jobs  {label:<18} build {timings[label] * 1e3:8.2f} ms  "
+                      f"store: {generate_site.FRAGMENT_STORE.stats()}")
+        finally:
+            os.chdir(cwd)
+    return timings
+
+
+def bench_matrix(locale_counts=(1, 2), theme_counts=(1, 4, 16)):
+    """
+    Time full builds of the locale x theme matrix. The stylesheet, script,
+    theme styles and critical CSS are built once and shared, so the time
+    per page should fall as the matrix grows. Returns {(locales, themes): seconds}.
+    """
+    timings = {}
+    for locale_count in locale_counts:
+        translations = dict(list(BASE_TRANSLATIONS.items())[:locale_count - 1])
+        for theme_count in theme_counts:
+            with using(BASE_CONTENT, synthetic_themes(theme_count), translations):
+                seconds = _time(_build_in_tempdir, repeat=3)
+            locales = 1 + len(translations)
+            timings[locales, theme_count] = seconds
+            pages = locales * theme_count
+            print(f"{pages:>6} pages  {locales} locale(s) x {theme_count:>3} theme(s)  build {seconds * 1e3:8.2f} ms  "
+                  f"{seconds / pages * 1e3:6.2f} ms per page")
+    return timings
+
+
+def entry_memory(entries):
+    """
+    Bytes held by `entries` jobs loaded from JSON as dicts and as BulletedJob
+    records, and the time to read every field of each. Both sides parse the
+    same document, so neither shares strings or lists with CONTENT.
+    """
+    with open(generate_site.CONTENT_SOURCES[0], encoding="utf-8") as f:
+        base = json.load(f)["experience"]
+    # The fields the cards read; only a few jobs carry resume overrides
+    jobs = []
+    for i in range(entries):
+        job = base[i % len(base)]
+        jobs.append({"company": f"{job['company']} #{i}", "title": job["title"], "date": job["date"],
+                     "bullets": job["bullets"]})
+    document = json.dumps(jobs)
+
+    tracemalloc.start()
+    dicts = json.loads(document)
+    dict_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    records = [generate_site._job(job) for job in json.loads(document)]
+    record_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The old card builder probed for "bullets" before reading the fields
+    dict_read = min(timeit.repeat(lambda: [
+        (d["company"], d["title"], d["date"], d["bullets"] if "bullets" in d else d["description"])
+        for d in dicts], number=3, repeat=3)) / 3
+    record_read = min(timeit.repeat(lambda: [
+        (r.company, r.title, r.date, r.bullets) for r in records], number=3, repeat=3)) / 3
+    print(f"{entries:>6} jobs  dicts {dict_bytes / 1e6:7.2f} MB  records {record_bytes / 1e6:7.2f} MB  "
+          f"({dict_bytes / record_bytes:4.2f}x smaller)  field reads {dict_read * 1e3:7.2f} ms → "
+          f"{record_read * 1e3:7.2f} ms")
+    return dict_bytes, record_bytes
+
+
+def peak_stream_memory(entries):
+    """Peak memory (bytes) of streaming the main page with `entries` experience cards"""
+    original = CONTENT["experience"]
+    CONTENT["experience"] = [original[i % len(original)] for i in range(entries)]
+    generate_site.FRAGMENT_CACHE.clear()
+    try:
+        with scratch_store(), open(os.devnull, "wb") as f:
+            tracemalloc.start()
+            generate_site.write_page("slate_blue", f)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    finally:
+        CONTENT["experience"] = original
+        generate_site.FRAGMENT_CACHE.clear()
+    return peak
+
+
+def peak_to_xml_memory(entries):
+    """Peak memory (bytes) of rendering the same page through to_xml"""
+    original = CONTENT["experience"]
+    CONTENT["experience"] = [original[i % len(original)] for i in range(entries)]
+    generate_site.FRAGMENT_CACHE.clear()
+    try:
+        with scratch_store():
+            tracemalloc.start()
+            generate_site.render_page("slate_blue")
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    finally:
+        CONTENT["experience"] = original
+        generate_site.FRAGMENT_CACHE.clear()
+    return peak
+
+
+# Synthetic scaling content
+
+BASE_CONTENT = copy.deepcopy(CONTENT)
+BASE_THEMES = copy.deepcopy(generate_site.THEMES)
+BASE_TRANSLATIONS = dict(generate_site.TRANSLATIONS)
+
+# Each dimension is scaled on its own, the others stay at 1x
+DIMENSIONS = ("paragraphs", "experience", "bullets", "themes")
+
+
+def synthetic_content(paragraphs=1, experience=1, bullets=1):
+    """
+    CONTENT with the About paragraphs, experience entries and bullets per
+    entry multiplied. Copies are numbered so they don't share cache entries.
+    """
+    content = dict(BASE_CONTENT)
+    about = content["about"]
+    content["about"] = dataclasses.replace(about, paragraphs=tuple(
+        f"{about.paragraphs[i % len(about.paragraphs)]} ({i})"
+        for i in range(len(about.paragraphs) * paragraphs)
+    ))
+    base_jobs = content["experience"]
+    jobs = []
+    for i in range(len(base_jobs) * experience):
+        job = base_jobs[i % len(base_jobs)]
+        job = dataclasses.replace(job, company=f"{job.company} #{i}")
+        if isinstance(job, generate_site.BulletedJob):
+            job = dataclasses.replace(job, bullets=tuple(
+                f"{job.bullets[j % len(job.bullets)]} ({j})"
+                for j in range(len(job.bullets) * bullets)
+            ))
+        jobs.append(job)
+    content["experience"] = tuple(jobs)
+    return content
+
+
+def synthetic_themes(count):
+    """count themes derived from the real ones, with distinct accent colors"""
+    base = list(BASE_THEMES.items())
+    themes = {}
+    for i in range(count):
+        key, theme = base[i % len(base)]
+        if i >= len(base):
+            key = f"{key}_{i}"
+            theme = dict(theme, name=f"{theme['name']} {i}", accent_dark=f"#{(i * 2654435761) % 0xFFFFFF:06x}")
+        themes[key] = theme
+    return themes
+
+
+@contextmanager
+def using(content, themes, translations=None):
+    """
+    Swap the generator's CONTENT, THEMES and TRANSLATIONS for the duration
+    of a benchmark; without translations only the default locale is built
+    """
+    saved = generate_site.CONTENT, generate_site.THEMES, generate_site.TRANSLATIONS
+    generate_site.CONTENT, generate_site.THEMES = content, themes
+    generate_site.TRANSLATIONS = translations or {}
+    FORMAT_CACHE.clear()
+    generate_site.FRAGMENT_CACHE.clear()
+    try:
+        yield
+    finally:
+        generate_site.CONTENT, generate_site.THEMES, generate_site.TRANSLATIONS = saved
+        FORMAT_CACHE.clear()
+        generate_site.FRAGMENT_CACHE.clear()
+
+
+@contextmanager
+def scratch_store():
+    """Swap FRAGMENT_STORE for an empty one in a temporary directory, leaving ./.cache alone"""
+    saved = generate_site.FRAGMENT_STORE
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_site.FRAGMENT_STORE = generate_site.FragmentStore(tmp, saved.max_bytes)
+        try:
+            yield
+        finally:
+            generate_site.FRAGMENT_STORE = saved
+
+
+def _time(fn, repeat):
+    """Best wall time of repeat calls to fn, in seconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _build_in_tempdir():
+    """The full build as run by __main__, in a scratch directory, without its output"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            with redirect_stdout(io.StringIO()):
+                generate_site.build(force=True)
+        finally:
+            os.chdir(cwd)
+
+
+def run_case(dimension, scale):
+    """Time every stage of the build with one dimension scaled up"""
+    factors = {name: scale if name == dimension else 1 for name in DIMENSIONS}
+    content = synthetic_content(factors["paragraphs"], factors["experience"], factors["bullets"])
+    themes = synthetic_themes(len(BASE_THEMES) * factors["themes"])
+    theme_key = next(iter(themes))
+    # Fewer repeats as inputs grow, so runs asked for with large --scales stay bounded
+    repeat = 5 if scale < 100 else 3 if scale < 10_000 else 1
+
+    def format_all():
+        FORMAT_CACHE.clear()
+        for para in content["about"].paragraphs:
+            format_text(para)
+
+    def generate():
+        # Only builds the lazy tree; the cards and fragments are rendered by iter_xml
+        generate_site.FRAGMENT_CACHE.clear()
+        generate_site.generate_page(theme_key)
+
+    def render():
+        generate_site.FRAGMENT_CACHE.clear()
+        with scratch_store():
+            generate_site.render_page(theme_key)
+
+    with using(content, themes):
+        page = generate_site.generate_page(theme_key)
+        stages = {
+            "format_text": _time(format_all, repeat),
+            "create_job_card": _time(lambda: [generate_site.create_job_card(job) for job in content["experience"]], repeat),
+            "create_style": _time(lambda: [generate_site.create_style(key) for key in themes], repeat),
+            "generate_page": _time(generate, repeat),
+            "render_page": _time(render, repeat),
+            "to_xml": _time(lambda: to_xml(page), repeat),
+            "build": _time(_build_in_tempdir, repeat),
+        }
+    return {
+        "dimension": dimension,
+        "scale": scale,
+        "sizes": {
+            "paragraphs": len(content["about"].paragraphs),
+            "experience": len(content["experience"]),
+            "bullets": sum(len(job.bullets) for job in content["experience"]),
+            "themes": len(themes),
+        },
+        "seconds": stages,
+    }
+
+
+def run_suite(scales, dimensions=DIMENSIONS):
+    """Run every (dimension, scale) case and return the results with run metadata"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    results = []
+    for dimension in dimensions:
+        for scale in scales:
+            case = run_case(dimension, scale)
+            timings = "  ".join(f"{stage} {seconds * 1e3:9.2f}ms" for stage, seconds in case["seconds"].items())
+            print(f"{dimension:<10} {scale:>6}x  {timings}")
+            results.append(case)
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def run_checks():
+    """Format and memory comparisons against the previous implementations"""
+    # Both implementations must agree on the real content
+    for para in CONTENT["about"].paragraphs:
+        assert to_xml(P(*format_text(para))) == to_xml(P(*format_text_regex(para))), para
+
+    bench("about paragraphs (joined)", " ".join(CONTENT["about"].paragraphs))
+    bench("long paragraph", long_paragraph())
+    bench("URLs and paths", slashy_paragraph())
+
+    # format_many matching format_text is checked in tests/test_format.py
+    paragraphs = [long_paragraph(words=80, seed=i) for i in range(1000)] + ["", None, "a_b", "_x_"]
+    bench_batch("short paragraphs", paragraphs)
+
+    # The theme template must render exactly what the f-string did
+    themes = synthetic_themes(500)
+    generate_site.validate_themes(themes)
+    for theme in themes.values():
+        assert generate_site.THEME_STYLE.render(theme) == create_style_fstring(theme)
+    bench_themes(500)
+
+    # Spliced and streamed pages are checked against to_xml in tests/test_xml.py
+    bench_fragments()
+
+    # Warm builds only render the fragments whose inputs changed
+    timings = bench_fragment_store()
+    print(f"Warm build {timings['cold'] / timings['warm']:.2f}x faster than cold, "
+          f"one bullet edited {timings['cold'] / timings['one bullet edited']:.2f}x")
+
+    # Shared work is done once per build, so bigger matrices should cost less per page
+    timings = bench_matrix()
+    per_page = {size: seconds / (size[0] * size[1]) for size, seconds in timings.items()}
+    smallest, largest = min(per_page), max(per_page)
+    print(f"Per page: {per_page[smallest] * 1e3:.2f} ms at {smallest[0]}x{smallest[1]}, "
+          f"{per_page[largest] * 1e3:.2f} ms at {largest[0]}x{largest[1]} "
+          f"({per_page[smallest] / per_page[largest]:.2f}x less)")
+
+    # Records hold an entry in less memory than the dict it was loaded from
+    dict_bytes, record_bytes = entry_memory(100_000)
+    assert record_bytes < dict_bytes
+
+    # Streaming keeps peak memory flat as the experience list grows
+    for entries in (10, 1_000, 10_000):
+        print(f"{entries:>6} experience entries  to_xml peak {peak_to_xml_memory(entries) / 1e6:8.2f} MB  "
+              f"streamed peak {peak_stream_memory(entries) / 1e6:6.2f} MB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="scale factors to run for each dimension")
+    parser.add_argument("--dimensions", nargs="+", choices=DIMENSIONS, default=list(DIMENSIONS),
+                        help="content dimensions to scale")
+    parser.add_argument("--output", default="benchmark-results.json",
+                        help="JSON file the results are written to")
+    parser.add_argument("--skip-checks", action="store_true",
+                        help="skip the format_text, theme template, fragment and memory comparisons")
+    args = parser.parse_args()
+
+    if not args.skip_checks:
+        run_checks()
+    report = run_suite(args.scales, args.dimensions)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
@@ -0,0 +1 @@
+window.nerdyFragment = "<div>\n  <div id=\"nerdy-about\">\n    <h3>\u2192 DETR\u00c1S DEL CIENT\u00cdFICO</h3>\n    <p>Me obsesionan los mundos, tanto reales como imaginarios.</p>\n    <p>\n<strong>La Tierra Media molde\u00f3 mi forma de ver el mundo.</strong> El Se\u00f1or de los Anillos me ense\u00f1\u00f3 que la gente peque\u00f1a puede cambiar la historia, que la comunidad importa m\u00e1s que la gloria individual y que las mejores aventuras llegan al decirle que s\u00ed a lo inesperado.    </p>\n    <p>\n<strong>La m\u00fasica me ense\u00f1\u00f3 la alegr\u00eda de la vida cotidiana.</strong> La m\u00fasica es mi cable a tierra, Daft Punk mi mantra. Es lo que me mantiene conectado con la gente    </p>\n    <p>\n<strong>La meditaci\u00f3n me mostr\u00f3 la brecha entre el mapa y el territorio.</strong> Quedarme quieto durante horas me mostr\u00f3 que la conciencia es m\u00e1s rara que cualquier sistema que hayamos construido; quiz\u00e1s la IA pueda ayudarnos con eso. Adem\u00e1s: la mayor parte de lo que creemos que es el \u201cyo\u201d es solo ruido.    </p>\n    <p>\n<strong>La ciencia es lo que me recuerda seguir asombr\u00e1ndome.</strong> El espacio, las estrellas, la f\u00edsica: son los campos que me encantar\u00eda estudiar en un universo de tiempo infinito.    </p>\n  </div>\n  <div id=\"nerdy-timeline\">\n    <div id=\"nerdy-tab-experience\" class=\"column nerdy-column\">\n      <h3>UNA L\u00cdNEA DE TIEMPO DISTINTA</h3>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>So\u00f1ando con la Tierra Media</h4>\n          </div>\n          <p class=\"job-date\">1990\u20142010</p>\n        </div>\n        <p class=\"job-description\">Me enamor\u00e9 de la construcci\u00f3n de mundos, de las b\u00fasquedas \u00e9picas y de la idea de que los hobbits, la gente m\u00e1s peque\u00f1a y m\u00e1s ignorada, pod\u00edan salvar el mundo.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Obsesi\u00f3n por la ciencia y la meditaci\u00f3n</h4>\n          </div>\n          <p class=\"job-date\">2010\u20142020</p>\n        </div>\n        <p class=\"job-description\">Descubr\u00ed que la neurociencia computacional pod\u00eda explicar la conciencia. Mientras tanto, me quedaba quieto durante horas intentando entenderla desde adentro.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Etapa Daft Punk</h4>\n          </div>\n          <p class=\"job-date\">2015\u20142018</p>\n        </div>\n        <p class=\"job-description\">Random Access Memories lo cambi\u00f3 todo. Me di cuenta de que la m\u00fasica electr\u00f3nica no es fr\u00eda: es lo m\u00e1s humano que hemos creado.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Construir para generar impacto</h4>\n          </div>\n          <p class=\"job-date\">2020\u2014actualidad</p>\n        </div>\n        <p class=\"job-description\">Convert\u00ed la angustia existencial en acci\u00f3n. Si la realidad est\u00e1 rota, arregl\u00e9mosla.</p>\n      </div>\n    </div>\n  </div>\n</div>\n";
@@ -4,100 +4,275 @@ Run this to generate all HTML files
 """
 
 from fasthtml.common import *
+from fasthtml.live_reload import LiveReloadJs
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field, fields
+from functools import cache, partial, singledispatch, wraps
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+import argparse
+import asyncio
+import fasthtml
+import gzip
+import hashlib
+import inspect
+import itertools
+import marshal
+import math
+import mimetypes
+import json
+import os
+import posixpath
 import re
+import ssl
+import sys
+import textwrap
+import time
+import uvicorn
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+
+# Formatting markers: each delimiter wraps the text between a pair of it
+MARKERS = {
+    "_": "italic",
+    "*": "bold",
+    "/": "underline",
+}
 
+_MARKER_RE = re.compile(f"[{re.escape(''.join(MARKERS))}]")
 
 
-def format_text(text):
+class Run(namedtuple("Run", "style children")):
+    """Backend-neutral formatted run: a MARKERS style around a tuple of str/Run"""
+    __slots__ = ()
+
+
+def _tokenize(text, starts=(0,)):
+    """
+    Find every marker in text and pair openers with closers in one pass.
+    Returns (positions, closer): positions[i] is the index of the i-th marker
+    in text and closer[i] is the index of the marker that closes it, or None.
+    A marker pairs with the next occurrence of the same character as long as
+    the span between them is not empty, like _[^_]+_ in a regex.
+    starts holds the offsets of independent segments (paragraphs joined into
+    one buffer); markers never pair across a segment boundary.
+    """
+    positions = [m.start() for m in _MARKER_RE.finditer(text)]
+    closer = [None] * len(positions)
+    following = {}
+    segment = len(starts) - 1
+    for i in range(len(positions) - 1, -1, -1):
+        while positions[i] < starts[segment]:
+            segment -= 1
+            following = {}
+        char = text[positions[i]]
+        j = following.get(char)
+        if j is not None and positions[j] > positions[i] + 1:
+            closer[i] = j
+        following[char] = i
+    return positions, closer
+
+
+def _build(text, positions, closer, lo, hi, start, end):
+    """Build the Run tree for text[start:end], whose markers are positions[lo:hi]"""
+    result = []
+    i = lo
+    while i < hi:
+        j = closer[i]
+        if j is None or j >= hi:
+            # Unpaired inside this span: keep it as plain text
+            i += 1
+            continue
+        pos = positions[i]
+        if start < pos:
+            result.append(text[start:pos])
+        inner = _build(text, positions, closer, i + 1, j, pos + 1, positions[j])
+        result.append(Run(MARKERS[text[pos]], tuple(inner)))
+        start = positions[j] + 1
+        i = j + 1
+    if start < end:
+        result.append(text[start:end])
+    return result
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry, with hit/miss/eviction counters"""
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, max_entries):
+        self.max_entries = max_entries
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0.0
+        return (f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions "
+                f"({rate:.0%} hit rate, {len(self)}/{self.max_entries} entries)")
+
+
+# Formatted paragraphs keyed on the raw text. The same paragraphs are rendered
+# for #about and #tab-about on every theme page, so most lookups hit.
+FORMAT_CACHE = LRUCache(max_entries=4096)
+
+# Theme-independent fragments, built and serialized once per build. Keys are
+# fragment names (FT trees) and (name, level, indent) (serialized strings)
+FRAGMENT_CACHE = LRUCache(max_entries=256)
+
+
+def parse_markup(text):
     """
-    Convert markdown-style formatting to FastHTML components
+    Parse markdown-style formatting into a backend-neutral tuple of str/Run
     Single:
-    _word_ -> italic (Em)
-    *word* -> bold (Strong)  
-    /word/ -> underline (U)
-    
-    Double (nested):
+    _word_ -> italic
+    *word* -> bold
+    /word/ -> underline
+
+    Markers nest in any order, outermost first:
     _*word*_ -> italic + bold
-    *_word_* -> bold + italic
-    /_word_/ -> underline + italic
-    /*word*/ -> underline + bold
-    _/word/_ -> italic + underline
-    */word/* -> bold + underline
-    
-    Triple (all three):
-    _*/word/*_ -> italic + bold + underline
-    _/*word*/_ -> italic + underline + bold
-    *_/word/_* -> bold + italic + underline
-    */_word_/* -> bold + underline + italic
     /_*word*_/ -> underline + italic + bold
-    /*_word_*/ -> underline + bold + italic
+    _word *bold* word_ -> italic with a bold word inside
+
+    Markers are defined in MARKERS; the text is scanned once, so the cost is
+    linear in its length no matter how many markers or slashes it contains.
+    Results are memoized in FORMAT_CACHE, so every backend (HTML pages, the
+    LaTeX resume) shares a single parse of each paragraph per build.
     """
-    if not text or not isinstance(text, str):
-        return [text] if text else []
-    
-    # Pattern matches: triple nesting (3 chars), double nesting (2 chars), then single (1 char)
-    # Order matters: check longest patterns first
-    pattern = r'(_\*/[^/]+/\*_|_/\*[^*]+\*/_|\*_/[^/]+/_\*|\*/_[^_]+_/\*|/_\*[^*]+\*_/|/\*_[^_]+_\*/|_\*[^*]+\*_|\*_[^_]+_\*|/_[^_]+_/|/\*[^*]+\*/|_/[^/]+/_|\*/[^/]+/\*|_[^_]+_|\*[^*]+\*|/[^/]+/)'
-    parts = re.split(pattern, text)
-    
-    result = []
-    for part in parts:
-        if not part:
+    return parse_many([text])[0]
+
+
+def parse_many(paragraphs):
+    """
+    Parse a list of paragraphs at once, same output as parse_markup on each.
+    Paragraphs missing from FORMAT_CACHE are joined into one buffer and
+    tokenized in a single pass, then the runs are split back out per
+    paragraph, so large documents avoid the per-call overhead.
+    """
+    results = [None] * len(paragraphs)
+    pending = {}  # uncached text -> indexes in paragraphs
+    for idx, text in enumerate(paragraphs):
+        if not text or not isinstance(text, str):
+            results[idx] = (text,) if text else ()
             continue
-        
-        # Triple nesting (3 markers)
-        if part.startswith('_*/') and part.endswith('/*_'):
-            # _*/text/*_ -> italic + bold + underline
-            result.append(Em(Strong(U(part[3:-3]))))
-        elif part.startswith('_/*') and part.endswith('*/_'):
-            # _/*text*/_ -> italic + underline + bold
-            result.append(Em(U(Strong(part[3:-3]))))
-        elif part.startswith('*_/') and part.endswith('/_*'):
-            # *_/text/_* -> bold + italic + underline
-            result.append(Strong(Em(U(part[3:-3]))))
-        elif part.startswith('*/_') and part.endswith('_/*'):
-            # */_text_/* -> bold + underline + italic
-            result.append(Strong(U(Em(part[3:-3]))))
-        elif part.startswith('/_*') and part.endswith('*_/'):
-            # /_*text*_/ -> underline + italic + bold
-            result.append(U(Em(Strong(part[3:-3]))))
-        elif part.startswith('/*_') and part.endswith('_*/'):
-            # /*_text_*/ -> underline + bold + italic
-            result.append(U(Strong(Em(part[3:-3]))))
-        # Double nesting (2 markers)
-        elif part.startswith('_*') and part.endswith('*_'):
-            # _*text*_ -> italic + bold
-            result.append(Em(Strong(part[2:-2])))
-        elif part.startswith('*_') and part.endswith('_*'):
-            # *_text_* -> bold + italic
-            result.append(Strong(Em(part[2:-2])))
-        elif part.startswith('/_') and part.endswith('_/'):
-            # /_text_/ -> underline + italic
-            result.append(U(Em(part[2:-2])))
-        elif part.startswith('/*') and part.endswith('*/'):
-            # /*text*/ -> underline + bold
-            result.append(U(Strong(part[2:-2])))
-        elif part.startswith('_/') and part.endswith('/_'):
-            # _/text/_ -> italic + underline
-            result.append(Em(U(part[2:-2])))
-        elif part.startswith('*/') and part.endswith('/*'):
-            # */text/* -> bold + underline
-            result.append(Strong(U(part[2:-2])))
-        # Single markers
-        elif part.startswith('_') and part.endswith('_'):
-            # _text_ -> italic
-            result.append(Em(part[1:-1]))
-        elif part.startswith('*') and part.endswith('*'):
-            # *text* -> bold
-            result.append(Strong(part[1:-1]))
-        elif part.startswith('/') and part.endswith('/'):
-            # /text/ -> underline
-            result.append(U(part[1:-1]))
+        cached = FORMAT_CACHE.get(text)
+        if cached is not None:
+            results[idx] = cached
         else:
-            # Plain text
-            result.append(part)
-    
-    return result
+            pending.setdefault(text, []).append(idx)
+
+    if pending:
+        texts = list(pending)
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text)
+        buffer = "".join(texts)
+        positions, closer = _tokenize(buffer, starts)
+
+        lo = 0
+        for text, start in zip(texts, starts):
+            end = start + len(text)
+            hi = bisect_left(positions, end, lo)
+            result = tuple(_build(buffer, positions, closer, lo, hi, start, end))
+            FORMAT_CACHE.put(text, result)
+            for idx in pending[text]:
+                results[idx] = result
+            lo = hi
+    return results
+
+
+# HTML backend: tag per style; runs become bare FT nodes, which skips the
+# component wrappers' argument processing and renders identically
+HTML_TAGS = {"italic": Em().tag, "bold": Strong().tag, "underline": U().tag}
+
+
+def to_html(parts):
+    """Convert parsed markup to FastHTML components"""
+    return tuple(
+        FT(HTML_TAGS[part.style], to_html(part.children), {}) if isinstance(part, Run) else part
+        for part in parts
+    )
+
+
+def format_text(text):
+    """Convert markdown-style formatting (see parse_markup) to FastHTML components"""
+    return to_html(parse_markup(text))
+
+
+def format_many(paragraphs):
+    """Format a list of paragraphs at once, same output as format_text on each"""
+    return [to_html(parts) for parts in parse_many(paragraphs)]
+
+
+# LaTeX backend: command per style, and escapes for LaTeX's special characters
+LATEX_COMMANDS = {"italic": r"\textit", "bold": r"\textbf", "underline": r"\underline"}
+LATEX_ESCAPES = {
+    "\\": r"\textbackslash{}", "&": r"\&", "%": r"\%", "$": r"\$", "#": r"\#",
+    "_": r"\_", "{": r"\{", "}": r"\}", "~": r"\textasciitilde{}", "^": r"\textasciicircum{}",
+    "—": "--",  # resume.tex writes dashes as en dashes
+}
+_LATEX_ESCAPE_RE = re.compile("|".join(map(re.escape, LATEX_ESCAPES)))
+
+
+def latex_escape(text):
+    """Escape plain text for LaTeX"""
+    return _LATEX_ESCAPE_RE.sub(lambda m: LATEX_ESCAPES[m.group()], text)
+
+
+def to_latex(parts):
+    """Convert parsed markup to LaTeX source"""
+    return "".join(
+        f"{LATEX_COMMANDS[part.style]}{{{to_latex(part.children)}}}" if isinstance(part, Run) else latex_escape(part)
+        for part in parts
+    )
 
 
 
@@ -141,240 +316,415 @@ THEMES = {
     },
 }
 
-# Page content - centralized to avoid duplication
-CONTENT = {
-    "name": "HERNÁN BARIJHOFF",
-    "subtitle": "MS CS | MLE | EA | Founder",
-    "tagline": "Building Mental Health tech that ",
-    "tagline_emphasis": "scales",
-    "email": "my_fullname@gmail.com",
-    "linkedin_url": "https://www.linkedin.com/in/hernanbarijhoff/",
-    "website_url": "https://mindappterapia.com",
-    
-    "about": {
-        "title": "What I Think",
-        "paragraphs": [
-
-            "I've experienced first hand the transformative power of therapy, but I've known so many people who didn't have the same experience, or didn't even try it because of bias or stigma. This frustrated me, and I started to wonder, what was wrong? The therapists' abilities? The process itself? Access? Society?",
-            "While researching societal problems, I came across the EA movement, and in particular, the work of a philosopher, Michael Plant, who proposes that /_*happiness*_/ should be the metric we should strive for, not 'years-lived' or 'lives-saved'. _What's the point of a life saved but riddled with suffering?_",
-            "At the same time, I've always wanted to build a startup, because I think it has the biggest impact of any endeavor you could pursue, if you can actually pull it off. ",
-            "My gut feeling was that it was worth diving deep into Mental Health, specifically /*facilitating access to quality therapy*/. That's how my current project MindApp started. I've learned things you can only learn by doing: how to balance patient needs with business sustainability, how edge cases reveal gaps in your initial thinking, when automated systems should escalate to human judgment. Being a founder taught me many different things — *about people, product, frustration, and purpose*. Invaluable learnings.  The most meaningful moments for me have been when a patient says *'thank you, you’ve helped me a lot .'*",
-            "Technology for me was always a means to an end. I studied and worked in AI because I understood early on that it was *one of the most powerful tools for creating real change in people's lives*. Before MindApp, I spent years in the startup ecosystem, learning as much as I could, including time at an early-stage YC company (EmiLabsYC19) building NLP chatbots to improve job access for frontline workers.",
-            "That's also why /I'm following AGI progress closely/ and participating in AI safety community events in Buenos Aires. *The timeline for world-changing AI is shorter than most people assume*, and Mental Health will be among the domains deeply reshaped—whether through AI-assisted therapy, companionship relationships, or risks we're only beginning to understand. I want to help ensure that transformation improves rather than undermines human wellbeing."
-            
-        ]
+# Interface strings per locale. The default locale is built at the site root;
+# every other locale that has a content file is built into its own directory
+LOCALES = {
+    "en": {
+        "name": "English",
+        "dark_mode": "Dark Mode",
+        "nerdy_mode": "Nerdy Mode",
+        "built": "What I've Built",
+        "academia": "Academia & Community",
+        "theme": "Theme",
+    },
+    "es": {
+        "name": "Español",
+        "dark_mode": "Modo oscuro",
+        "nerdy_mode": "Modo nerd",
+        "built": "Lo que construí",
+        "academia": "Academia y comunidad",
+        "theme": "Tema",
+    },
+}
+DEFAULT_LOCALE = "en"
+
+# Page content lives in content.json (or a .toml file with the same shape),
+# translated into content.<locale>.json next to it.
+# Keys ending in "?" are optional; a one-element list means "list of".
+# Paragraphs, bullets and descriptions may use the format_text markup.
+CONTENT_FILE = "content.json"
+
+_CARD_SCHEMA = {"title": str, "subtitle": str, "date": str, "description": str}
+
+CONTENT_SCHEMA = {
+    "name": str,
+    "subtitle": str,
+    "tagline": str,
+    "tagline_emphasis": str,
+    "email": str,
+    "linkedin_url": str,
+    "website_url": str,
+    "about": {"title": str, "paragraphs": [str]},
+    # Jobs have either bullets or a description. The optional resume entry
+    # holds the details only resume-experience.tex carries: another company
+    # name, and per bullet (by position, {} for none; the description counts
+    # as one) a replacement text, a suffix and a nested list of items
+    "experience": [{
+        "company": str, "title": str, "date": str, "bullets?": [str], "description?": str,
+        "resume?": {"company?": str, "bullets?": [{"text?": str, "suffix?": str, "items?": [str]}]},
+    }],
+    "academia": [_CARD_SCHEMA],
+    # Nerdy Mode content - rendered into a separate fragment that the page only
+    # fetches the first time the toggle is switched on
+    "nerdy": {
+        "about": {"title": str, "paragraphs": [str]},
+        "timeline_title": str,
+        "timeline": [_CARD_SCHEMA],
     },
-    
-    "experience": [
-        {
-            "company": "MindApp Therapy",
-            "title": "Founder & CEO",
-            "date": "Jan 2023 — Present",
-            "bullets": [
-                "Founded and built bootstrapped, profitable online therapy platform serving 380 patients/month at peak across Spain, USA, and Latin America with network of 22 therapists",
-                "Designed evidence-based protocols and policies through iterative real-world testing",
-                "Balanced therapy access, clinical quality, therapist autonomy, and business sustainability while growing therapist network through structured vetting and patient retention monitoring",
-                "Hired and managed 4-person customer service team",
-                "Built platform end-to-end using AWS, FastAPI, WhatsApp Platform, and Google/Meta ads"
-            ]
-        },
-        {
-            "company": "Startup Exploration",
-            "title": "Independent Research",
-            "date": "2022",
-            "bullets": [
-                "WeSex (SexEdTech): Ran structured 2-month cofounder trial; identified product was pre-PMF",
-                "Adopted EA cause prioritization framework, pivoted to mental health based on tractability and personal fit",
-                "Stenox (Blockchain): Built bot and investment data analytics product; reached YC interview stage"
-            ]
-        },
-        {
-            "company": "Emi Labs (YC19)",
-            "title": "Sr. Machine Learning Engineer",
-            "date": "Oct 2019 — Jan 2022",
-            "bullets": [
-                "Led NLP pipeline design and implementation for Chatbot (Rasa), with the mission of improving employment access for frontline workers",
-                "Coordinated company-wide knowledge-sharing talks with both internal and external speakers",
-                "Shaped product direction as fifth employee, including pragmatic scope decisions (e.g., eliminating unnecessary NLP classification when simpler solutions existed)"
-            ]
-        },
-        {
-            "company": "Mercado Libre (AMZ of Latam)",
-            "title": "Data Scientist (Jr → Sr)",
-            "date": "Dec 2016 — Oct 2019",
-            "bullets": [
-                "Developed Collaborative Filtering Recommendation Models for millions of users (meta-prod2vec)",
-                "Built ETL pipelines processing billions of events daily and implemented monitoring infra",
-                "Built Sales KPIs reporting for CTR, conversion, attribution and coverage metrics",
-                "Developed deployment infra at scale"
-            ]
-        }
-    ],
-    
-    "academia": [
-        {
-            "title": "NeurIPS Presentation",
-            "subtitle": "ML Open Source Software Workshop",
-            "date": "2018",
-            "description": "Presented Ms. Thesis"
-        },
-        {
-            "title": "Universidad de Buenos Aires",
-            "subtitle": "Master's in Computer Science",
-            "date": "2013 — 2018",
-            "description": "Thesis: PyLissom - A tool for modeling computational maps of the visual cortex in PyTorch"
-        },
-        {
-            "title": "Data Science Argentina",
-            "subtitle": "Meetup Speaker",
-            "date": "",
-            "description": ""
-        },
-        {
-            "title": "EA @ Buenos Aires",
-            "subtitle": "Regular Participant",
-            "date": "",
-            "description": ""
-        },
-        {
-            "title": "Patch Adams Volunteer",
-            "subtitle": "Hospital Clown",
-            "date": "",
-            "description": ""
-        }
-    ]
 }
 
+# Next to the script, not in the working directory: importing the module loads the content
+CONTENT_CACHE_DIR = Path(__file__).resolve().with_name(".cache")
+
+
+class ContentError(ValueError):
+    """The content file can't be parsed or doesn't match CONTENT_SCHEMA"""
+
+
+def _validate(value, schema, path, errors):
+    """Append a message to errors for every place value doesn't match schema"""
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected an object, got {type(value).__name__}")
+            return
+        keys = {key.rstrip("?"): key.endswith("?") for key in schema}
+        for key, optional in keys.items():
+            if key in value:
+                _validate(value[key], schema.get(key, schema.get(f"{key}?")), f"{path}.{key}", errors)
+            elif not optional:
+                errors.append(f"{path}: missing {key!r}")
+        errors.extend(f"{path}: unknown key {key!r}" for key in value if key not in keys)
+    elif isinstance(schema, list):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected a list, got {type(value).__name__}")
+            return
+        for i, item in enumerate(value):
+            _validate(item, schema[0], f"{path}[{i}]", errors)
+    elif not isinstance(value, schema):
+        errors.append(f"{path}: expected {schema.__name__}, got {type(value).__name__}")
+
+
+def validate_content(content):
+    """Raise ContentError listing every mismatch between content and CONTENT_SCHEMA"""
+    errors = []
+    _validate(content, CONTENT_SCHEMA, "content", errors)
+    jobs = content.get("experience", []) if isinstance(content, dict) else []
+    for i, job in enumerate(jobs):
+        if isinstance(job, dict) and ("bullets" in job) == ("description" in job):
+            errors.append(f"content.experience[{i}]: needs exactly one of 'bullets' or 'description'")
+    if not errors:
+        # Resume bullets are matched to the site's by position
+        for i, job in enumerate(jobs):
+            count = len(job["bullets"]) if "bullets" in job else 1
+            overrides = job.get("resume", {}).get("bullets", ())
+            if len(overrides) > count:
+                errors.append(f"content.experience[{i}].resume.bullets: {len(overrides)} entries for {count} bullet(s)")
+    if errors:
+        raise ContentError("\n".join(errors))
+    return content
+
+
+def _parse_content(path, raw):
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise ContentError(f"{path}: reading TOML needs Python 3.11+ (tomllib)")
+        try:
+            return tomllib.loads(raw.decode("utf-8"))
+        except tomllib.TOMLDecodeError as e:
+            raise ContentError(f"{path}: {e}") from None
+    try:
+        return json.loads(raw)
+    except ValueError as e:
+        raise ContentError(f"{path}: {e}") from None
+
+
+# Content entries are turned into records once at load time, so renderers
+# read attributes and dispatch on type instead of probing dict keys
+
+@dataclass(frozen=True, slots=True)
+class AboutSection:
+    title: str
+    paragraphs: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeBullet:
+    """How the resume differs from the site bullet in the same position"""
+    text: str = None
+    suffix: str = ""
+    items: tuple = ()
+
+
+@dataclass(frozen=True, slots=True)
+class ResumeEntry:
+    company: str = None
+    bullets: tuple = None
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    company: str
+    title: str
+    date: str
+    resume: ResumeEntry = field(default=None, kw_only=True)
+
+
+@dataclass(frozen=True, slots=True)
+class BulletedJob(Job):
+    bullets: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class DescribedJob(Job):
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class AcademiaItem:
+    title: str
+    subtitle: str
+    date: str
+    description: str
+
+
+def _about(about):
+    return AboutSection(about["title"], tuple(about["paragraphs"]))
+
+
+def _resume(resume):
+    bullets = resume.get("bullets")
+    if bullets is not None:
+        bullets = tuple(ResumeBullet(bullet.get("text"), bullet.get("suffix", ""), tuple(bullet.get("items", ())))
+                        for bullet in bullets)
+    return ResumeEntry(resume.get("company"), bullets)
+
 
-def create_style(theme_key):
-    """Generate CSS with theme colors"""
-    theme = THEMES[theme_key]
-    
-    return Style(f"""
-        :root[data-theme="light"] {{
-            --bg-color: {theme['bg_light']};
-            --bg-secondary: {theme['bg_light']};
-            --text-color: #1a1a1a;
-            --text-secondary: #666666;
-            --border-color: #e0e0e0;
-            --accent-color: {theme['accent_light']};
-            --accent-hover: {theme['accent_light']};
-            --card-bg: #ffffff;
-            --card-border: #e5e7eb;
-        }}
+def _job(job):
+    resume = _resume(job["resume"]) if "resume" in job else None
+    if "bullets" in job:
+        return BulletedJob(job["company"], job["title"], job["date"], tuple(job["bullets"]), resume=resume)
+    return DescribedJob(job["company"], job["title"], job["date"], job["description"], resume=resume)
+
+
+def content_records(content):
+    """Validated content with its sections and entries as records"""
+    nerdy = content["nerdy"]
+    return {
+        **content,
+        "about": _about(content["about"]),
+        "experience": tuple(map(_job, content["experience"])),
+        "academia": tuple(AcademiaItem(**item) for item in content["academia"]),
+        "nerdy": {
+            **nerdy,
+            "about": _about(nerdy["about"]),
+            "timeline": tuple(AcademiaItem(**item) for item in nerdy["timeline"]),
+        },
+    }
+
+
+def _content_cache_key():
+    """Changes with CONTENT_SCHEMA and the marshal format, so older cache entries are ignored"""
+    return hashlib.sha256(f"{CONTENT_SCHEMA!r}:{marshal.version}".encode()).hexdigest()
+
+
+def load_content(path=CONTENT_FILE):
+    """
+    Load and validate the content file and build its records.
+    The validated data is cached in CONTENT_CACHE_DIR as marshal data, keyed
+    on CONTENT_SCHEMA so a schema change validates again. A matching
+    mtime and size is trusted without reading the file; otherwise the file
+    is hashed and the cache is still used if the bytes are the same. Only
+    changed content is parsed and validated again.
+    """
+    path = Path(path)
+    stat = path.stat()
+    cache = CONTENT_CACHE_DIR / f"content-{hashlib.sha256(str(path.resolve()).encode()).hexdigest()[:16]}.marshal"
+    key = _content_cache_key()
+    cached = None
+    try:
+        cached = marshal.loads(cache.read_bytes())
+        if cached["key"] != key:
+            cached = None
+    except (OSError, EOFError, ValueError, TypeError, KeyError):
+        cached = None
+    if cached and (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return content_records(cached["data"])
+
+    raw = path.read_bytes()
+    sha256 = hashlib.sha256(raw).hexdigest()
+    if cached and cached["sha256"] == sha256:
+        data = cached["data"]
+    else:
+        data = validate_content(_parse_content(path, raw))
+    CONTENT_CACHE_DIR.mkdir(exist_ok=True)
+    cache.write_bytes(marshal.dumps({
+        "key": key, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size,
+        "sha256": sha256, "data": data,
+    }))
+    return content_records(data)
+
+
+def translation_path(path, locale):
+    """Where the translation of a content file into locale lives: content.es.json for content.json"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{locale}{path.suffix}")
+
+
+def use_content(path=CONTENT_FILE):
+    """
+    Load a content file, with the translations found next to it, and make
+    them the content every page is built from. Nothing changes if any of
+    them fails to load.
+    """
+    global CONTENT, CONTENT_SOURCES, TRANSLATIONS
+    path = Path(path)
+    content, translations, sources = load_content(path), {}, [path]
+    for locale in LOCALES:
+        translated = translation_path(path, locale)
+        if locale != DEFAULT_LOCALE and translated.exists():
+            translations[locale] = load_content(translated)
+            sources.append(translated)
+    CONTENT, TRANSLATIONS, CONTENT_SOURCES = content, translations, tuple(sources)
+    FRAGMENT_CACHE.clear()
+
+
+def content_for(locale):
+    """Content records of a locale; the default locale's are CONTENT"""
+    return CONTENT if locale == DEFAULT_LOCALE else TRANSLATIONS[locale]
+
+
+def site_locales():
+    """Locales the site is built in: the default one, then every translation"""
+    return [DEFAULT_LOCALE, *TRANSLATIONS]
+
+
+def locale_path(locale, filename):
+    """Path of an output file in a locale's directory; the default locale's is the site root"""
+    return filename if locale == DEFAULT_LOCALE else f"{locale}/{filename}"
 
-        :root[data-theme="dark"] {{
-            --bg-color: {theme['bg_dark']};
-            --bg-secondary: {theme['bg_secondary_dark']};
-            --text-color: #f0f0f0;
-            --text-secondary: #a0a0a0;
-            --border-color: #333333;
-            --accent-color: {theme['accent_dark']};
-            --accent-hover: {theme['accent_hover_dark']};
-            --card-bg: {theme['bg_secondary_dark']};
-            --card-border: #2a2a2a;
-        }}
 
-        * {{
+def site_root(locale):
+    """Relative URL from a locale's pages back to the shared assets at the site root"""
+    return "" if locale == DEFAULT_LOCALE else "../"
+
+
+# Content files are found next to this script, wherever it is run from
+use_content(Path(__file__).with_name(CONTENT_FILE))
+
+NERDY_FILE = "nerdy.html"
+NERDY_SCRIPT_FILE = "nerdy.js"  # the same fragment for pages opened from file://, which can't fetch it
+RESUME_FILE = "resume-experience.tex"  # \input by resume.tex
+
+
+# Rules shared by every theme. They only reference the custom properties set
+# per theme in create_style, so one copy is written to site.css and cached by
+# the browser across index.html and every design-*.html page.
+SITE_CSS = """
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
+
+        /* Nodes the client script switches off; wins over any display rule */
+        [hidden] {
+            display: none !important;
+        }
 
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, sans-serif;
             background: var(--bg-color);
             color: var(--text-color);
             line-height: 1.7;
             transition: background-color 0.3s ease, color 0.3s ease;
-        }}
+        }
 
-        .container {{
+        .container {
             max-width: 1100px;
             margin: 0 auto;
             padding: 40px 24px;
-        }}
+        }
 
         /* Header */
-        header {{
+        header {
             margin-bottom: 40px;
             display: grid;
             grid-template-columns: 25% 1fr;
             align-items: start;
             gap: 40px;
-        }}
+        }
 
-        .header-left {{
+        .header-left {
             justify-self: start;
-        }}
+        }
 
-        .header-box {{
+        .header-box {
             display: inline-block;
             border: 2px solid var(--accent-color);
             padding: 12px 24px;
             border-radius: 8px;
             background: var(--bg-secondary);
-        }}
+        }
 
-        h1 {{
+        h1 {
             font-size: 28px;
             font-weight: 800;
             letter-spacing: -0.5px;
-        }}
+        }
 
-        .header-center {{
+        .header-center {
             display: flex;
             justify-content: space-between;
             align-items: start;
             gap: 20px;
-        }}
+        }
 
-        .hero-content {{
+        .hero-content {
             flex: 1;
-        }}
+        }
 
-        .contact-links {{
+        .contact-links {
             display: flex;
             flex-direction: row;
             gap: 12px;
             align-items: center;
             margin-top: 8px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .contact-links a {{
+        .contact-links a {
             color: var(--accent-color);
             text-decoration: none;
             font-size: 14px;
             font-weight: 500;
             transition: opacity 0.2s;
-        }}
+        }
 
-        .contact-links a:hover {{
+        .contact-links a:hover {
             opacity: 0.7;
-        }}
+        }
 
-        .tagline {{
+        .tagline {
             font-size: 17px;
             color: var(--text-secondary);
             margin-bottom: 0;
             font-weight: 500;
-        }}
+        }
 
-        .tagline-emphasis {{
+        .tagline-emphasis {
             color: var(--accent-color);
             font-weight: 700;
-        }}
+        }
 
-        .subtitle {{
+        .subtitle {
             font-size: 12px;
             color: var(--text-secondary);
             margin-top: 6px;
             font-weight: 500;
             letter-spacing: 0.5px;
-        }}
+        }
 
-        .hero-link {{
+        .hero-link {
             display: inline-block;
             margin-top: 8px;
             padding: 10px 20px;
@@ -385,28 +735,28 @@ def create_style(theme_key):
             font-weight: 600;
             font-size: 17px;
             transition: all 0.2s;
-        }}
+        }
 
-        .hero-link:hover {{
+        .hero-link:hover {
             background: var(--accent-hover);
             transform: translateY(-2px);
-        }}
+        }
 
         /* Toggle Switch */
-        .toggle-container {{
+        .toggle-container {
             display: flex;
             flex-direction: column;
             align-items: center;
             gap: 6px;
-        }}
+        }
 
-        .toggle-label-top {{
+        .toggle-label-top {
             font-size: 11px;
             color: var(--text-secondary);
             font-weight: 500;
-        }}
+        }
 
-        .toggle-switch {{
+        .toggle-switch {
             position: relative;
             width: 60px;
             height: 30px;
@@ -414,9 +764,9 @@ def create_style(theme_key):
             border-radius: 15px;
             cursor: pointer;
             transition: background 0.3s;
-        }}
+        }
 
-        .toggle-switch::after {{
+        .toggle-switch::after {
             content: '';
             position: absolute;
             width: 24px;
@@ -426,25 +776,25 @@ def create_style(theme_key):
             top: 3px;
             left: 3px;
             transition: transform 0.3s;
-        }}
+        }
 
-        .toggle-switch.active {{
+        .toggle-switch.active {
             background: var(--accent-color);
-        }}
+        }
 
-        .toggle-switch.active::after {{
+        .toggle-switch.active::after {
             transform: translateX(30px);
-        }}
+        }
 
-        section {{
+        section {
             margin-bottom: 40px;
-        }}
+        }
 
-        #about {{
+        #about {
             display: block;
-        }}
+        }
 
-        .section-header {{
+        .section-header {
             font-size: 22px;
             font-weight: 800;
             margin-bottom: 20px;
@@ -452,40 +802,40 @@ def create_style(theme_key):
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
 
-        .section-header::before {{
+        .section-header::before {
             content: "→";
             color: var(--accent-color);
             font-size: 24px;
-        }}
+        }
 
         /* About Section */
-        .about-content p {{
+        .about-content p {
             font-size: 15px;
             margin-bottom: 12px;
             line-height: 1.6;
-        }}
+        }
 
-        .about-content p:first-child {{
+        .about-content p:first-child {
             font-size: 16px;
             font-weight: 600;
             color: var(--accent-color);
-        }}
+        }
 
         /* Mobile Tabs */
-        .mobile-tabs {{
+        .mobile-tabs {
             display: none;
             margin-bottom: 20px;
-        }}
+        }
 
-        .tab-buttons {{
+        .tab-buttons {
             display: flex;
             gap: 10px;
             border-bottom: 2px solid var(--border-color);
-        }}
+        }
 
-        .tab-button {{
+        .tab-button {
             flex: 1;
             padding: 12px;
             background: none;
@@ -496,35 +846,35 @@ def create_style(theme_key):
             font-size: 16px;
             font-weight: 600;
             transition: all 0.2s;
-        }}
+        }
 
-        .tab-button.active {{
+        .tab-button.active {
             color: var(--accent-color);
             border-bottom-color: var(--accent-color);
-        }}
+        }
 
-        .tab-content {{
+        .tab-content {
             display: none;
-        }}
+        }
 
-        .tab-content.active {{
+        .tab-content.active {
             display: block;
-        }}
+        }
 
-        @media (min-width: 901px) {{
-            .tab-content {{
+        @media (min-width: 901px) {
+            .tab-content {
                 display: none !important;
-            }}
-        }}
+            }
+        }
 
         /* Two Column Layout */
-        .two-column {{
+        .two-column {
             display: grid;
             grid-template-columns: 2fr 1fr;
             gap: 30px;
-        }}
+        }
 
-        .column h3 {{
+        .column h3 {
             font-size: 18px;
             font-weight: 800;
             margin-bottom: 16px;
@@ -532,16 +882,16 @@ def create_style(theme_key):
             display: flex;
             align-items: center;
             gap: 8px;
-        }}
+        }
 
-        .column h3::before {{
+        .column h3::before {
             content: "→";
             color: var(--accent-color);
             font-size: 20px;
-        }}
+        }
 
         /* Job Cards */
-        .job {{
+        .job {
             background: var(--card-bg);
             border: 1px solid var(--card-border);
             border-left: 3px solid var(--accent-color);
@@ -549,96 +899,113 @@ def create_style(theme_key):
             padding: 16px;
             margin-bottom: 16px;
             transition: all 0.3s;
-        }}
+        }
 
-        .job:hover {{
+        .job:hover {
             border-color: var(--accent-color);
             box-shadow: 0 2px 8px rgba(0, 0, 0, 0.1);
             transform: translateX(2px);
-        }}
+        }
 
-        .job-header {{
+        .job-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 10px;
             flex-wrap: wrap;
             gap: 8px;
-        }}
+        }
 
-        .job-title-row {{
+        .job-title-row {
             display: flex;
             align-items: center;
             gap: 12px;
             flex-wrap: wrap;
-        }}
+        }
 
-        .academia-title-col {{
+        .academia-title-col {
             display: flex;
             flex-direction: column;
             gap: 4px;
-        }}
+        }
 
-        .job h4 {{
+        .job h4 {
             font-size: 17px;
             font-weight: 700;
             margin-bottom: 0;
             color: var(--text-color);
             display: inline;
-        }}
+        }
 
-        .job-separator {{
+        .job-separator {
             color: var(--text-secondary);
             font-weight: 400;
-        }}
+        }
 
-        .job-title {{
+        .job-title {
             font-size: 14px;
             color: var(--accent-color);
             font-weight: 600;
             margin-bottom: 0;
             display: inline;
-        }}
+        }
 
-        .job-date {{
+        .job-date {
             font-size: 13px;
             color: var(--text-secondary);
             white-space: nowrap;
             margin-bottom: 0;
             font-weight: 500;
-        }}
+        }
 
-        .job-bullets {{
+        .job-bullets {
             list-style: none;
             padding: 0;
-        }}
+        }
 
-        .job-bullets li {{
+        .job-bullets li {
             padding-left: 20px;
             position: relative;
             margin-bottom: 8px;
             font-size: 14px;
             line-height: 1.6;
-        }}
+        }
 
-        .job-bullets li::before {{
+        .job-bullets li::before {
             content: "▸";
             position: absolute;
             left: 0;
             color: var(--accent-color);
             font-weight: bold;
             font-size: 16px;
-        }}
+        }
 
-        .job-description {{
+        .job-description {
             font-size: 14px;
             line-height: 1.6;
             color: var(--text-secondary);
             margin-top: 6px;
-        }}
+        }
+
+        /* Nerdy Mode (fragment loaded from nerdy.html) */
+        .about-content h3 {
+            margin-bottom: 15px;
+        }
+
+        .nerdy-column {
+            grid-column: 1 / -1;
+        }
+
+        /* The timeline spans both desktop columns; the academia column is
+           only hidden there, as it is still a tab pane on mobile */
+        @media (min-width: 901px) {
+            .nerdy #tab-academia {
+                display: none;
+            }
+        }
 
         /* Nerdy Timeline */
-        .nerdy-timeline {{
+        .nerdy-timeline {
             background: linear-gradient(135deg, var(--card-bg) 0%, var(--bg-secondary) 100%);
             border: 2px solid var(--accent-color);
             border-radius: 12px;
@@ -646,9 +1013,9 @@ def create_style(theme_key):
             margin-bottom: 24px;
             position: relative;
             overflow: hidden;
-        }}
+        }
 
-        .nerdy-timeline::before {{
+        .nerdy-timeline::before {
             content: "";
             position: absolute;
             left: 0;
@@ -656,24 +1023,24 @@ def create_style(theme_key):
             bottom: 0;
             width: 6px;
             background: var(--accent-color);
-        }}
+        }
 
-        .nerdy-timeline h4 {{
+        .nerdy-timeline h4 {
             font-size: 24px;
             font-weight: 800;
             color: var(--accent-color);
             margin-bottom: 16px;
-        }}
+        }
 
-        .timeline-description {{
+        .timeline-description {
             margin-top: 12px;
             font-size: 17px;
             line-height: 1.7;
             color: var(--text-secondary);
-        }}
+        }
 
         /* Footer with toggles */
-        footer {{
+        footer {
             border-top: 2px solid var(--border-color);
             padding-top: 40px;
             margin-top: 80px;
@@ -682,285 +1049,721 @@ def create_style(theme_key):
             align-items: center;
             flex-wrap: wrap;
             gap: 20px;
-        }}
+        }
 
-        .footer-toggles {{
+        .footer-toggles {
             display: flex;
             gap: 30px;
             align-items: center;
-        }}
+        }
+
+        .locale-links {
+            display: flex;
+            gap: 16px;
+            font-size: 14px;
+        }
+
+        .locale-links a {
+            color: var(--text-secondary);
+            text-decoration: none;
+        }
+
+        .locale-links a:hover,
+        .locale-links a[aria-current] {
+            color: var(--accent-color);
+        }
 
-        .toggle-label {{
+        .toggle-label {
             display: flex;
             align-items: center;
             gap: 12px;
             font-size: 14px;
             color: var(--text-secondary);
-        }}
+        }
 
         /* Responsive */
-        @media (max-width: 900px) {{
-            .two-column {{
+        @media (max-width: 900px) {
+            /* The desktop columns double as the mobile tab panes */
+            .two-column {
+                display: block;
+            }
+
+            .column {
                 display: none;
-            }}
+            }
+
+            .column.active {
+                display: block;
+            }
 
-            .column {{
+            .column h3 {
                 display: none;
-            }}
+            }
 
-            .mobile-tabs {{
+            .mobile-tabs {
                 display: block;
-            }}
+            }
 
-            #about {{
+            #about {
                 display: none;
-            }}
+            }
 
-            footer {{
+            footer {
                 flex-direction: column;
                 text-align: center;
-            }}
-        }}
+            }
+        }
 
-        @media (max-width: 768px) {{
-            .container {{
+        @media (max-width: 768px) {
+            .container {
                 padding: 30px 20px;
-            }}
+            }
 
-            header {{
+            header {
                 display: flex;
                 flex-direction: column;
                 align-items: stretch;
                 margin-bottom: 30px;
                 gap: 15px;
-            }}
+            }
 
-            .header-left {{
+            .header-left {
                 justify-self: auto;
                 display: flex;
                 justify-content: center;
                 width: 100%;
-            }}
+            }
 
-            .header-box {{
+            .header-box {
                 padding: 10px 20px;
                 flex: 1;
-            }}
+            }
 
-            h1 {{
+            h1 {
                 font-size: 24px;
-            }}
+            }
 
-            .header-center {{
+            .header-center {
                 order: 2;
-            }}
+            }
 
-            .hero-content {{
+            .hero-content {
                 text-align: center;
-            }}
+            }
 
-            .toggle-container {{
+            .toggle-container {
                 display: none;
-            }}
+            }
 
-            .contact-links {{
+            .contact-links {
                 flex-direction: row;
                 justify-content: center;
                 gap: 8px;
-            }}
+            }
 
-            .tagline {{
+            .tagline {
                 font-size: 15px;
-            }}
+            }
 
-            .section-header {{
+            .section-header {
                 font-size: 20px;
-            }}
+            }
 
-            .job {{
+            .job {
                 padding: 14px;
-            }}
+            }
 
-            .job h4 {{
+            .job h4 {
                 font-size: 16px;
-            }}
+            }
 
-            .two-column {{
+            .two-column {
                 grid-template-columns: 1fr;
-            }}
+            }
 
             /* Make experience cards vertical on mobile */
-            .experience-card .job-title-row {{
+            .experience-card .job-title-row {
                 flex-direction: column;
                 align-items: flex-start;
                 gap: 4px;
-            }}
+            }
 
-            .experience-card .job-separator {{
+            .experience-card .job-separator {
                 display: none;
-            }}
+            }
 
-            .experience-card .job-title {{
+            .experience-card .job-title {
                 display: block;
-            }}
+            }
 
-            .experience-card .job-header {{
+            .experience-card .job-header {
                 align-items: flex-start;
-            }}
-        }}
-    """)
-
-
-def create_script():
-    """JavaScript for dark mode, nerdy mode, and mobile tabs"""
-    return Script("""
-        // Dark Mode Toggle
-        function initDarkMode() {
-            const darkModeToggle = document.getElementById('darkModeToggle');
-            const html = document.documentElement;
-            
-            const savedTheme = localStorage.getItem('theme') || 'dark';
-            html.setAttribute('data-theme', savedTheme);
-            if (darkModeToggle) {
-                darkModeToggle.classList.toggle('active', savedTheme === 'dark');
-            }
-            
-            if (darkModeToggle) {
-                darkModeToggle.addEventListener('click', () => {
-                    const currentTheme = html.getAttribute('data-theme');
-                    const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-                    
-                    html.setAttribute('data-theme', newTheme);
-                    localStorage.setItem('theme', newTheme);
-                    darkModeToggle.classList.toggle('active', newTheme === 'dark');
-                });
             }
         }
+"""
 
-        // Nerdy Mode Toggle
-        function initNerdyMode() {
-            const toggle = document.getElementById('nerdyToggle');
-            const aboutDiv = document.querySelector('.about-content'); // Changed to class selector
-            const expColumn = document.querySelector('.two-column');
-            
-            // Mobile tabs
-            const mobileAbout = document.getElementById('tab-about');
-            const mobileExp = document.getElementById('tab-experience');
-            const mobileAcad = document.getElementById('tab-academia');
-            
-            if (!toggle) return;
-            
-            // Store originals
-            const origAbout = aboutDiv ? aboutDiv.innerHTML : '';
-            const origExp = expColumn ? expColumn.innerHTML : '';
-            const origMobileAbout = mobileAbout ? mobileAbout.innerHTML : '';
-            const origMobileExp = mobileExp ? mobileExp.innerHTML : '';
-            let isNerdy = false;
-            
-            // Fun content
-            const nerdyAboutHTML = '<h3 style="margin-bottom: 15px;">→ BEHIND THE SCIENTIST</h3><p>I\\'m obsessed with worlds—both real and imagined.</p><p><strong>Middle Earth shaped my worldview.</strong> LOTR taught me that small people can change history, that fellowship matters more than individual glory, and that the best adventures come from saying yes to the unexpected.</p><p><strong>Music taught me about the joy of everyday life.</strong> Music is my lifeline, daft punk my mantra. It’s what keeps me connected to people</p><p><strong>Meditation revealed the gap between map and territory.</strong> Sitting still for hours showed me that consciousness is weirder than any system we built, maybe AI can help us with that. Also: most of what we think is “I” is just noise.</p><p><strong>Science is what reminds me to keep wondering.</strong> Space, stars, physics, are the fields that I would love to study in an infinite-time universe.</p>';
-            
-            const nerdyTimelineHTML = '<div class="job" style="border-left: 3px solid var(--accent-color); padding-left: 20px; margin-bottom: 20px;"><h4 style="color: var(--accent-color); margin-bottom: 8px;">1990—2010: LOTR Dreaming</h4><p>Fell in love with world-building, epic quests, and the idea that hobbits—the smallest, most overlooked people—could save the world.</p></div>' +
-                '<div class="job" style="border-left: 3px solid var(--accent-color); padding-left: 20px; margin-bottom: 20px;"><h4 style="color: var(--accent-color); margin-bottom: 8px;">2010—2020: Science & Meditation Obsession</h4><p>Discovered computational neuroscience could explain consciousness. Meanwhile, sat still for hours trying to understand it from the inside.</p></div>' +
-                '<div class="job" style="border-left: 3px solid var(--accent-color); padding-left: 20px; margin-bottom: 20px;"><h4 style="color: var(--accent-color); margin-bottom: 8px;">2015—2018: Daft Punk Phase</h4><p>Random Access Memories changed everything. Realized electronic music isn\\'t cold—it\\'s the most human thing we\\'ve made.</p></div>' +
-                '<div class="job" style="border-left: 3px solid var(--accent-color); padding-left: 20px;"><h4 style="color: var(--accent-color); margin-bottom: 8px;">2020—Present: Building for Impact</h4><p>Turned the existential angst into action. If reality is broken, let\\'s fix it.</p></div>';
-            
-            toggle.addEventListener('click', () => {
-                isNerdy = !isNerdy;
-                
-                if (isNerdy) {
-                    // Nerdy mode ON
-                    // Desktop
-                    if (aboutDiv) aboutDiv.innerHTML = nerdyAboutHTML;
-                    if (expColumn) expColumn.innerHTML = '<div class="column" style="grid-column: 1 / -1;"><h3>→ A DIFFERENT TIMELINE</h3>' + nerdyTimelineHTML + '</div>';
-                    
-                    // Mobile
-                    if (mobileAbout) mobileAbout.innerHTML = nerdyAboutHTML;
-                    if (mobileExp) mobileExp.innerHTML = nerdyTimelineHTML;
-                    if (mobileAcad) mobileAcad.style.display = 'none';
-                    
-                    toggle.classList.add('active');
-                } else {
-                    // Nerdy mode OFF - restore
-                    // Desktop
-                    if (aboutDiv) aboutDiv.innerHTML = origAbout;
-                    if (expColumn) expColumn.innerHTML = origExp;
-                    
-                    // Mobile
-                    if (mobileAbout) mobileAbout.innerHTML = origMobileAbout;
-                    if (mobileExp) mobileExp.innerHTML = origMobileExp;
-                    if (mobileAcad) mobileAcad.style.display = '';
-                    
-                    toggle.classList.remove('active');
-                }
-                
-                document.getElementById('about').scrollIntoView({ behavior: 'smooth' });
-            });
-        }
-
-        // Mobile Tabs
-        function initMobileTabs() {
-            const tabButtons = document.querySelectorAll('.tab-button');
-            const tabContents = document.querySelectorAll('.tab-content');
-            
-            tabButtons.forEach(button => {
-                button.addEventListener('click', () => {
-                    const targetTab = button.dataset.tab;
-                    
-                    tabButtons.forEach(btn => btn.classList.remove('active'));
-                    tabContents.forEach(content => content.classList.remove('active'));
-                    
-                    button.classList.add('active');
-                    document.getElementById(targetTab).classList.add('active');
-                });
-            });
-        }
+SITE_CSS_FILE = "site.css"
 
-        document.addEventListener('DOMContentLoaded', () => {
-            initDarkMode();
-            initNerdyMode();
-            initMobileTabs();
-        });
-    """)
 
+# Per-theme custom properties; each $slot is filled from the theme dict
+THEME_TEMPLATE = """
+        :root[data-theme="light"] {
+            --bg-color: $bg_light;
+            --bg-secondary: $bg_light;
+            --text-color: #1a1a1a;
+            --text-secondary: #666666;
+            --border-color: #e0e0e0;
+            --accent-color: $accent_light;
+            --accent-hover: $accent_light;
+            --card-bg: #ffffff;
+            --card-border: #e5e7eb;
+        }
+
+        :root[data-theme="dark"] {
+            --bg-color: $bg_dark;
+            --bg-secondary: $bg_secondary_dark;
+            --text-color: #f0f0f0;
+            --text-secondary: #a0a0a0;
+            --border-color: #333333;
+            --accent-color: $accent_dark;
+            --accent-hover: $accent_hover_dark;
+            --card-bg: $bg_secondary_dark;
+            --card-border: #2a2a2a;
+        }
+    """
+
+
+class ThemeError(ValueError):
+    """A theme is missing keys the stylesheet template needs"""
+
+
+class ThemeTemplate:
+    """
+    A stylesheet template split once into (static text, slot) pairs, so a
+    theme renders with one join over the pairs instead of a substitution
+    scan of the whole template
+    """
+
+    _SLOT_RE = re.compile(r"\$(\w+)")
+
+    def __init__(self, template):
+        # split alternates static text and slot names: text, key, text, ..., text
+        parts = self._SLOT_RE.split(template)
+        self.keys = tuple(parts[1::2])
+        self._pairs = tuple(zip(parts[0::2], self.keys))
+        self._tail = parts[-1]
+
+    @property
+    def required(self):
+        """Keys every theme needs: its display name and each slot"""
+        return {"name", *self.keys}
+
+    def render(self, theme):
+        """Fill the slots from a theme dict"""
+        return "".join([static + theme[key] for static, key in self._pairs]) + self._tail
 
+
+THEME_STYLE = ThemeTemplate(THEME_TEMPLATE)
+
+
+def validate_themes(themes):
+    """Raise ThemeError listing every theme that is missing a required key or has a non-string value"""
+    errors = []
+    for theme_key, theme in themes.items():
+        missing = sorted(THEME_STYLE.required - theme.keys())
+        if missing:
+            errors.append(f"themes.{theme_key}: missing {', '.join(missing)}")
+        errors.extend(f"themes.{theme_key}.{key}: expected str, got {type(value).__name__}"
+                      for key, value in theme.items() if not isinstance(value, str))
+    if errors:
+        raise ThemeError("\n".join(errors))
+
+
+def create_style(theme_key):
+    """Generate the theme's custom properties; the shared rules live in SITE_CSS"""
+    return Style(THEME_STYLE.render(THEMES[theme_key]))
+
+
+def create_stylesheet_link(root=""):
+    """
+    Non-blocking link to the shared stylesheet, versioned by its content hash
+    for cache busting. It is preloaded and applied once it arrives, so only
+    the inlined critical rules block the first paint; browsers without
+    JavaScript get a regular link. root leads from the page to the site root.
+    """
+    href = f"{root}{SITE_CSS_FILE}?v={_digest(render_site_css())[:12]}"
+    return (
+        Link(rel="preload", href=href, onload="this.onload=null;this.rel='stylesheet'", **{"as": "style"}),
+        Noscript(Link(rel="stylesheet", href=href)),
+    )
+
+
+# Critical CSS: the rules needed to paint everything up to the end of the
+# element with this id are inlined in the head. #tab-about is the About
+# section's mobile pane and comes right after it, so both layouts are covered
+CRITICAL_UNTIL = "tab-about"
+# Bytes the first render may need: one TCP initial window (10 segments)
+FIRST_RENDER_BUDGET = 14 * 1024
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_IGNORED_RE = re.compile(r"::?[\w-]+(\([^)]*\))?|\[[^\]]*\]")  # pseudo-classes/elements, attributes
+_CSS_COMPOUND_RE = re.compile(r"[#.]?[\w-]+|\*")
+_SCRIPT_CLASS_RE = re.compile(r"classList\.(?:add|toggle)\('([\w-]+)'")
+
+
+def _css_blocks(css):
+    """Split CSS into top-level (prelude, body) pairs; @media bodies are split again by the caller"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    blocks = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(css):
+        if char == "{":
+            if depth == 0:
+                prelude, open_at = css[start:i].strip(), i
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                blocks.append((prelude, css[open_at + 1:i]))
+                start = i + 1
+    return blocks
+
+
+def _selector_matches(selector, names):
+    """
+    Whether every compound of a selector names a tag, .class or #id in names.
+    Pseudo-classes and attribute selectors are ignored, so this errs on the
+    side of keeping a rule.
+    """
+    selector = _CSS_IGNORED_RE.sub(" ", selector)
+    return all(token == "*" or token in names for token in _CSS_COMPOUND_RE.findall(selector))
+
+
+def _fold_names(elm, names):
+    """
+    Add the tags, .classes and #ids of elm to names in document order, until
+    the element whose id is CRITICAL_UNTIL is closed. Returns True once it is.
+    """
+    if hasattr(elm, "__ft__") and not isinstance(elm, FT):
+        elm = elm.__ft__()
+    if isinstance(elm, (list, tuple)):
+        return any(_fold_names(child, names) for child in elm)
+    if not isinstance(elm, FT):
+        return False
+    names.add(elm.tag)
+    names.update(f".{cls}" for cls in str(elm.attrs.get("class", "")).split())
+    if "id" in elm.attrs:
+        names.add(f"#{elm.attrs['id']}")
+    return _fold_names(elm.children, names) or elm.attrs.get("id") == CRITICAL_UNTIL
+
+
+@cache
+def critical_css(names):
+    """Rules of the shared stylesheet that can apply to the given frozenset of names"""
+    rules = []
+    for prelude, body in _css_blocks(render_site_css().decode("utf-8")):
+        if prelude.startswith("@media"):
+            inner = [f"{sel} {{{rule}}}" for sel, rule in _css_blocks(body)
+                     if any(_selector_matches(part, names) for part in sel.split(","))]
+            if inner:
+                rules.append(f"{prelude} {{\n    " + "\n    ".join(inner) + "\n}")
+        elif prelude.startswith("@"):
+            rules.append(f"{prelude} {{{body}}}")  # @font-face and friends are kept as they are
+        elif any(_selector_matches(part, names) for part in prelude.split(",")):
+            rules.append(f"{prelude} {{{body}}}")
+    return "\n".join(rules)
+
+
+def create_critical_style(body):
+    """
+    Inline the stylesheet rules needed to paint the above-the-fold part of
+    body (everything up to the end of the CRITICAL_UNTIL element). Classes the client
+    script adds (the toggles' .active) count as present.
+    """
+    names = {"html", ":root"}
+    _fold_names(body, names)
+    names.update(f".{cls}" for cls in _SCRIPT_CLASS_RE.findall(SITE_JS))
+    return Style(critical_css(frozenset(names)))
+
+
+def render_site_css(_=None):
+    """Render the shared stylesheet to the exact bytes written to disk"""
+    return textwrap.dedent(SITE_CSS).lstrip().encode("utf-8")
+
+
+# data-theme rendered on <html>, used until a saved or system preference says otherwise
+DEFAULT_COLOR_SCHEME = "dark"
+
+# Inline and synchronous in <head>: it runs before the body is parsed, so the
+# first paint already has the right data-theme and the document is never
+# restyled at load. Saved preference first, then prefers-color-scheme, then
+# the server-rendered default
+THEME_SCRIPT = """
+        (function () {
+            var root = document.documentElement, theme;
+            try { theme = localStorage.getItem('theme'); } catch (e) {}
+            if (theme !== 'light' && theme !== 'dark' && window.matchMedia) {
+                theme = matchMedia('(prefers-color-scheme: light)').matches ? 'light'
+                    : matchMedia('(prefers-color-scheme: dark)').matches ? 'dark' : null;
+            }
+            if (theme && theme !== root.getAttribute('data-theme')) root.setAttribute('data-theme', theme);
+        })();
+"""
+
+
+def create_theme_script():
+    """Head script that resolves the color scheme before first paint"""
+    return Script(textwrap.dedent(THEME_SCRIPT).strip())
+
+
+# Client script for dark mode, nerdy mode and mobile tabs, written to
+# site.js and loaded with defer, so it never blocks parsing or first paint
+SITE_JS = """
+        // Deferred: the document has been parsed by the time this runs
+
+        let isNerdy = false;
+
+        // Dark Mode Toggle
+        function initDarkMode() {
+            const darkModeToggle = document.getElementById('darkModeToggle');
+            const html = document.documentElement;
+            
+            // data-theme was resolved in <head> before first paint
+            if (darkModeToggle) {
+                darkModeToggle.classList.toggle('active', html.getAttribute('data-theme') === 'dark');
+            }
+            
+            if (darkModeToggle) {
+                darkModeToggle.addEventListener('click', () => {
+                    const currentTheme = html.getAttribute('data-theme');
+                    const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+                    
+                    html.setAttribute('data-theme', newTheme);
+                    localStorage.setItem('theme', newTheme);
+                    darkModeToggle.classList.toggle('active', newTheme === 'dark');
+                });
+            }
+        }
+
+        // Nerdy Mode Toggle
+        // The fragment is fetched and parsed once; its nodes are added next to
+        // the normal content and switching modes only flips their `hidden`
+        function initNerdyMode() {
+            const toggle = document.getElementById('nerdyToggle');
+            const aboutDiv = document.querySelector('.about-content');
+            const expColumn = document.querySelector('.two-column');
+            
+            // Mobile tabs
+            const mobileAbout = document.getElementById('tab-about');
+            
+            if (!toggle) return;
+            
+            // Adds hidden nodes to a container; returns them with the children they
+            // replace (all of the container's own, unless given)
+            function attach(container, nodes, own) {
+                if (!container) return null;
+                own = own || [...container.children];
+                nodes.forEach(node => { node.hidden = true; });
+                container.append(...nodes);
+                return { own, nodes };
+            }
+            
+            // The fragment's markup. Pages opened from file:// can't fetch it,
+            // but can still run a script that carries it
+            function fetchNerdy() {
+                if (location.protocol !== 'file:') {
+                    return fetch(toggle.dataset.src).then(response => {
+                        if (!response.ok) throw new Error(`${response.status} ${response.url}`);
+                        return response.text();
+                    });
+                }
+                return new Promise((resolve, reject) => {
+                    const script = document.createElement('script');
+                    script.src = toggle.dataset.script;
+                    script.onload = () => resolve(window.nerdyFragment);
+                    script.onerror = () => { script.remove(); reject(new Error(`Could not load ${script.src}`)); };
+                    document.head.append(script);
+                });
+            }
+            
+            // Fun content, loaded from the prebuilt fragment on first use
+            let nerdyContent = null;
+            function loadNerdy() {
+                if (!nerdyContent) {
+                    nerdyContent = fetchNerdy()
+                        .then(html => {
+                            const template = document.createElement('template');
+                            template.innerHTML = html;
+                            const about = [...template.content.getElementById('nerdy-about').children];
+                            const timeline = [...template.content.getElementById('nerdy-timeline').children];
+                            return [
+                                attach(mobileAbout, about.map(node => node.cloneNode(true))),
+                                attach(aboutDiv, about),
+                                // Only the experience column is swapped; on mobile the
+                                // academia tab keeps its cards
+                                attach(expColumn, timeline,
+                                       expColumn && [...expColumn.querySelectorAll(':scope > .nerdy-replaced')]),
+                            ].filter(Boolean);
+                        });
+                    // Let the next click retry if the request failed
+                    nerdyContent.catch(() => { nerdyContent = null; });
+                }
+                return nerdyContent;
+            }
+            
+            toggle.addEventListener('click', async () => {
+                let groups;
+                try {
+                    groups = await loadNerdy();
+                } catch (err) {
+                    console.error('Could not load Nerdy Mode', err);
+                    return;
+                }
+                isNerdy = !isNerdy;
+                
+                for (const { own, nodes } of groups) {
+                    own.forEach(node => { node.hidden = isNerdy; });
+                    nodes.forEach(node => { node.hidden = !isNerdy; });
+                }
+                toggle.classList.toggle('active', isNerdy);
+                document.body.classList.toggle('nerdy', isNerdy);
+                
+                // The columns are also the mobile tab panes
+                const activeTab = document.querySelector('.tab-button.active');
+                if (activeTab) showTab(activeTab.dataset.tab);
+                
+                document.getElementById('about').scrollIntoView({ behavior: 'smooth' });
+            });
+        }
+
+        // Mobile Tabs
+        // In Nerdy Mode a pane can have a nerdy- counterpart (the timeline column)
+        function tabPane(tab) {
+            return (isNerdy && document.getElementById(`nerdy-${tab}`)) || document.getElementById(tab);
+        }
+
+        function showTab(targetTab) {
+            document.querySelectorAll('.tab-button').forEach(btn => {
+                const isTarget = btn.dataset.tab === targetTab;
+                btn.classList.toggle('active', isTarget);
+                const pane = tabPane(btn.dataset.tab);
+                if (pane) pane.classList.toggle('active', isTarget);
+            });
+        }
+
+        function initMobileTabs() {
+            document.querySelectorAll('.tab-button').forEach(button => {
+                button.addEventListener('click', () => showTab(button.dataset.tab));
+            });
+        }
+
+        initDarkMode();
+        initNerdyMode();
+        initMobileTabs();
+"""
+
+SITE_JS_FILE = "site.js"
+
+
+def render_site_js(_=None):
+    """Render the client script to the exact bytes written to disk"""
+    return textwrap.dedent(SITE_JS).lstrip().encode("utf-8")
+
+
+def create_script(root=""):
+    """Deferred client script, versioned by its content hash for cache busting"""
+    return Script(src=f"{root}{SITE_JS_FILE}?v={_digest(render_site_js())[:12]}", defer=True)
+
+
+class LazyChildren:
+    """
+    Children built on demand by calling builder on each item.
+    to_xml expands them all at once through __ft__, while iter_xml builds,
+    serializes and drops them one at a time, so long lists of cards never
+    exist in memory all together.
+    """
+
+    def __init__(self, builder, items, store=None):
+        self.builder = builder
+        self.items = items
+        self.store = store  # FRAGMENT_STORE kind, to reuse each child's markup across builds
+
+    def __iter__(self):
+        if self.store:
+            return (StoredFragment(self.store, self.builder, item) for item in self.items)
+        return map(self.builder, self.items)
+
+    def __ft__(self):
+        return tuple(self)
+
+
+class Fragment:
+    """
+    A part of the page that is the same on every page naming it; names carry
+    the locale or asset root when the part depends on it. The FT tree is
+    built on first use; iter_xml serializes it once for each indent level it
+    appears at and splices the cached string into every later page. to_xml
+    and other tree walkers see the plain tree through __ft__.
+    """
+
+    __slots__ = ("name", "builder")
+
+    def __init__(self, name, builder):
+        self.name = name
+        self.builder = builder
+
+    def __ft__(self):
+        tree = FRAGMENT_CACHE.get(self.name)
+        if tree is None:
+            tree = self.builder()
+            FRAGMENT_CACHE.put(self.name, tree)
+        return tree
+
+    def serialize(self, lvl, indent):
+        key = (self.name, lvl, indent)
+        xml = FRAGMENT_CACHE.get(key)
+        if xml is None:
+            xml = "".join(iter_xml(self.__ft__(), lvl, indent))
+            FRAGMENT_CACHE.put(key, xml)
+        return xml
+
+
+class StoredFragment:
+    """
+    builder(arg), looked up in FRAGMENT_STORE by iter_xml under kind and key
+    (the data the markup depends on, arg itself by default). to_xml and
+    other tree walkers build it through __ft__.
+    """
+
+    __slots__ = ("kind", "builder", "arg", "key")
+
+    def __init__(self, kind, builder, arg, key=None):
+        self.kind = kind
+        self.builder = builder
+        self.arg = arg
+        self.key = arg if key is None else key
+
+    def __ft__(self):
+        return self.builder(self.arg)
+
+
+class FragmentStore:
+    """
+    Content-addressed on-disk store of serialized fragments, kept across
+    builds. A fragment's address hashes its kind, its key data, the indent
+    level it is serialized at and GENERATOR_VERSION, so a build after an
+    edit only renders the fragments whose inputs changed. Hits refresh the
+    file's mtime, and evict() deletes the least recently used files once
+    the store is larger than max_bytes. Paths are plain strings: pathlib
+    interns every name it parses, which grows with the number of fragments.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = {}
+        self.misses = {}
+
+    def fetch(self, fragment, lvl, indent):
+        """The fragment serialized at lvl, read from disk or rendered and stored"""
+        kind = fragment.kind
+        path = os.path.join(self.directory, _digest([kind, GENERATOR_VERSION, lvl, indent, fragment.key]))
+        try:
+            with open(path, "rb") as f:
+                xml = f.read().decode("utf-8")
+        except FileNotFoundError:
+            pass
+        else:
+            self.hits[kind] = self.hits.get(kind, 0) + 1
+            os.utime(path)
+            return xml
+        self.misses[kind] = self.misses.get(kind, 0) + 1
+        xml = "".join(iter_xml(fragment.__ft__(), lvl, indent))
+        os.makedirs(self.directory, exist_ok=True)
+        # Workers may store the same fragment at once; each replace is atomic
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(xml.encode("utf-8"))
+        os.replace(tmp, path)
+        return xml
+
+    def evict(self):
+        """Delete the least recently used fragments until the store fits in max_bytes; returns how many"""
+        try:
+            entries = sorted((entry.stat().st_mtime_ns, entry.stat().st_size, entry.path)
+                             for entry in os.scandir(self.directory) if entry.is_file())
+        except FileNotFoundError:
+            return 0
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            evicted += 1
+        return evicted
+
+    def reset_stats(self):
+        self.hits.clear()
+        self.misses.clear()
+
+    def stats(self):
+        kinds = sorted(self.hits.keys() | self.misses.keys())
+        parts = []
+        for kind in kinds:
+            hits, misses = self.hits.get(kind, 0), self.misses.get(kind, 0)
+            parts.append(f"{kind} {hits}/{hits + misses} hits ({hits / (hits + misses):.0%})")
+        return ", ".join(parts) or "not used"
+
+
+FRAGMENT_STORE = FragmentStore(CONTENT_CACHE_DIR / "fragments", max_bytes=64 * 2**20)
+
+
+def create_paragraph(text):
+    """A paragraph with its formatting markup applied"""
+    return P(*format_text(text))
+
+
+def _job_header(job):
+    return Div(
+        Div(
+            H4(job.company),
+            Span(" • ", cls="job-separator"),
+            Span(job.title, cls="job-title"),
+            cls="job-title-row"
+        ),
+        P(job.date, cls="job-date"),
+        cls="job-header"
+    )
+
+
+@singledispatch
 def create_job_card(job):
-    """Create a job card from job data"""
-    if "bullets" in job:
-        # Job with bullet points
-        return Div(
-            Div(
-                Div(
-                    H4(job["company"]),
-                    Span(" • ", cls="job-separator"),
-                    Span(job["title"], cls="job-title"),
-                    cls="job-title-row"
-                ),
-                P(job["date"], cls="job-date"),
-                cls="job-header"
-            ),
-            Ul(
-                *[Li(bullet) for bullet in job["bullets"]],
-                cls="job-bullets"
-            ),
-            cls="job experience-card"
-        )
-    else:
-        # Job with description
-        return Div(
-            Div(
-                Div(
-                    H4(job["company"]),
-                    Span(" • ", cls="job-separator"),
-                    Span(job["title"], cls="job-title"),
-                    cls="job-title-row"
-                ),
-                P(job["date"], cls="job-date"),
-                cls="job-header"
-            ),
-            P(job["description"], cls="job-description"),
-            cls="job experience-card"
-        )
+    """Create a job card from a Job record"""
+    raise TypeError(f"no job card for {type(job).__name__}")
+
+
+@create_job_card.register
+def _(job: BulletedJob):
+    return Div(
+        _job_header(job),
+        Ul(
+            *[Li(*parts) for parts in format_many(job.bullets)],
+            cls="job-bullets"
+        ),
+        cls="job experience-card"
+    )
+
+
+@create_job_card.register
+def _(job: DescribedJob):
+    return Div(
+        _job_header(job),
+        P(*format_text(job.description), cls="job-description"),
+        cls="job experience-card"
+    )
 
 
 def create_academia_card(item):
@@ -968,167 +1771,1315 @@ def create_academia_card(item):
     return Div(
         Div(
             Div(
-                H4(item["title"]),
-                P(item["subtitle"], cls="job-title"),
+                H4(item.title),
+                P(item.subtitle, cls="job-title") if item.subtitle else None,
                 cls="academia-title-col"
             ),
-            P(item["date"], cls="job-date") if item["date"] else None,
+            P(item.date, cls="job-date") if item.date else None,
             cls="job-header"
         ),
-        P(item["description"], cls="job-description"),
+        P(*format_text(item.description), cls="job-description"),
         cls="job"
     )
 
 
-def generate_page(theme_key):
-    """Generate a complete HTML page for a theme"""
-    
-    return Html(
-        Head(
-            Meta(charset="UTF-8"),
-            Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
-            Title("Hernán Barijhoff"),
-            create_style(theme_key),
+def create_nerdy_fragment(locale=DEFAULT_LOCALE):
+    """Nerdy Mode content, rendered with the same builders as the main page"""
+    nerdy = content_for(locale)["nerdy"]
+    about = nerdy["about"]
+    return Div(
+        Div(
+            H3(f"→ {about.title}"),
+            LazyChildren(create_paragraph, about.paragraphs, store="paragraph"),
+            id="nerdy-about"
         ),
-        Body(
+        Div(
+            # Shown instead of both columns; it is the experience tab's pane on mobile
             Div(
-                # Header
-                Header(
-                    # Left: Name box (25%)
-                    Div(
-                        Div(
-                            H1(CONTENT["name"]),
-                            P(CONTENT["subtitle"], cls="subtitle"),
-                            cls="header-box"
-                        ),
-                        cls="header-left"
-                    ),
-                    # Right: Hero content + Toggle (75%)
-                    Div(
-                        # Hero content (tagline + contact)
-                        Div(
-                            P(
-                                CONTENT["tagline"],
-                                Span(CONTENT["tagline_emphasis"], cls="tagline-emphasis"),
-                                cls="tagline"
-                            ),
-                            Div(
-                                A(CONTENT["email"], href=f"mailto:{CONTENT['email']}"),
-                                A("LinkedIn", href=CONTENT["linkedin_url"], target="_blank"),
-                                A("mindappterapia.com", href=CONTENT["website_url"], target="_blank"),
-                                cls="contact-links"
-                            ),
-                            cls="hero-content"
-                        ),
-                        # Dark mode toggle
-                        Div(
-                            Span("Dark Mode", cls="toggle-label-top"),
-                            Div(cls="toggle-switch", id="darkModeToggle"),
-                            cls="toggle-container"
-                        ),
-                        cls="header-center"
-                    ),
+                H3(nerdy["timeline_title"]),
+                LazyChildren(create_academia_card, nerdy["timeline"], store="academia-card"),
+                cls="column nerdy-column",
+                id="nerdy-tab-experience"
+            ),
+            id="nerdy-timeline"
+        ),
+    )
+
+
+def render_nerdy_fragment(locale=DEFAULT_LOCALE):
+    """Render a locale's Nerdy Mode fragment to the exact bytes written to disk"""
+    return "".join(iter_xml(create_nerdy_fragment(locale))).encode("utf-8")
+
+
+def render_nerdy_script(locale=DEFAULT_LOCALE):
+    """The Nerdy Mode fragment as a script that hands it to the page, for pages opened from file://"""
+    html = render_nerdy_fragment(locale).decode("utf-8")
+    return f"window.nerdyFragment = {json.dumps(html)};\n".encode("utf-8")
+
+
+def _resume_item(text, items):
+    """A \\resumeItem, with its nested items as a compact itemize"""
+    if not items:
+        return f"  \\resumeItem{{{to_latex(text)}}}"
+    return "\n".join([
+        f"  \\resumeItem{{{to_latex(text)}",
+        r"    \begin{itemize}[nosep, after={}]",
+        *(f"      \\item {to_latex(item)}" for item in items),
+        r"    \end{itemize}}",
+    ])
+
+
+def create_resume_experience():
+    """
+    Experience section of resume.tex as \\resumeSubheading/\\resumeItem
+    blocks, from the site's bullets (or description). A job's resume entry
+    can rename the company and replace, extend or add items to bullets.
+    """
+    blocks = [f"% Generated by {Path(__file__).name} from {CONTENT_FILE}; do not edit", r"\section*{Experience}"]
+    for job in CONTENT["experience"]:
+        resume = job.resume or ResumeEntry()
+        texts = job.bullets if isinstance(job, BulletedJob) else (job.description,)
+        overrides = resume.bullets or ()
+        bullets = [ResumeBullet(f"{override.text or text}{override.suffix}", items=override.items)
+                   for text, override in zip(texts, overrides + (ResumeBullet(),) * (len(texts) - len(overrides)))]
+        # One batch per job, so each bullet and item is parsed once
+        parsed = iter(parse_many([text for bullet in bullets for text in (bullet.text, *bullet.items)]))
+        company = resume.company or job.company
+        blocks.append("\n".join([
+            r"\resumeSubheading",
+            f"  {{{latex_escape(company)} -- {latex_escape(job.title)}}}{{{latex_escape(job.date)}}}",
+            r"\begin{itemize}",
+            *(_resume_item(next(parsed), [next(parsed) for _ in bullet.items]) for bullet in bullets),
+            r"\end{itemize}",
+        ]))
+    return "\n\n".join(blocks) + "\n"
+
+
+def render_resume_experience(_=None):
+    """Render the resume's Experience section to the exact bytes written to disk"""
+    return create_resume_experience().encode("utf-8")
+
+
+def create_header(locale=DEFAULT_LOCALE):
+    """Name box, tagline, contact links and the dark mode toggle"""
+    content, ui = content_for(locale), LOCALES[locale]
+    return Header(
+        # Left: Name box (25%)
+        Div(
+            Div(
+                H1(content["name"]),
+                P(content["subtitle"], cls="subtitle"),
+                cls="header-box"
+            ),
+            cls="header-left"
+        ),
+        # Right: Hero content + Toggle (75%)
+        Div(
+            # Hero content (tagline + contact)
+            Div(
+                P(
+                    content["tagline"],
+                    Span(content["tagline_emphasis"], cls="tagline-emphasis"),
+                    cls="tagline"
                 ),
-                
-                # Main Content
-                Main(
-                    # Who I Am Section
-                    Section(
-                        H2(CONTENT["about"]["title"], cls="section-header"),
-                        Div(
-                            *[P(*format_text(para)) for para in CONTENT["about"]["paragraphs"]],
-                            cls="about-content"
-                        ),
-                        id="about"
-                    ),
-                    
-                    # Experience Section (no section header, just tabs and columns)
-                    Section(
-                        # Mobile Tabs
-                        Div(
-                            Div(
-                                Button("What I Think", cls="tab-button active", **{"data-tab": "tab-about"}),
-                                Button("What I've Built", cls="tab-button", **{"data-tab": "tab-experience"}),
-                                Button("Academia & Community", cls="tab-button", **{"data-tab": "tab-academia"}),
-                                cls="tab-buttons"
-                            ),
-                            cls="mobile-tabs"
-                        ),
-                        
-                        Div(
-                            # Mobile Tab Content - Who I Am
-                            Div(
-                                *[P(*format_text(para)) for para in CONTENT["about"]["paragraphs"]],
-                                cls="tab-content active about-content",
-                                id="tab-about"
-                            ),
-                            
-                            # Mobile Tab Content - Experience
-                            Div(
-                                *[create_job_card(job) for job in CONTENT["experience"]],
-                                cls="tab-content",
-                                id="tab-experience"
-                            ),
-                            
-                            # Mobile Tab Content - Academia
-                            Div(
-                                *[create_academia_card(item) for item in CONTENT["academia"]],
-                                cls="tab-content",
-                                id="tab-academia"
-                            ),
-                            
-                            # Desktop Two-Column Layout
-                            Div(
-                                # Left Column - What I've Built
-                                Div(
-                                    H3("What I've Built"),
-                                    *[create_job_card(job) for job in CONTENT["experience"]],
-                                    cls="column"
-                                ),
-                                # Right Column - Academia & Community
-                                Div(
-                                    H3("Academia & Community"),
-                                    *[create_academia_card(item) for item in CONTENT["academia"]],
-                                    cls="column"
-                                ),
-                                cls="two-column",
-                                id="experienceContent"
-                            ),
-                        ),
-                        id="experience"
-                    ),
+                Div(
+                    A(content["email"], href=f"mailto:{content['email']}"),
+                    A("LinkedIn", href=content["linkedin_url"], target="_blank"),
+                    A("mindappterapia.com", href=content["website_url"], target="_blank"),
+                    cls="contact-links"
                 ),
-                
-                # Footer with toggles
-                Footer(
-                    P(f"Theme: {THEMES[theme_key]['name']}", style="color: var(--text-secondary); font-size: 14px;"),
+                cls="hero-content"
+            ),
+            # Dark mode toggle
+            Div(
+                Span(ui["dark_mode"], cls="toggle-label-top"),
+                Div(cls="toggle-switch", id="darkModeToggle"),
+                cls="toggle-container"
+            ),
+            cls="header-center"
+        ),
+    )
+
+
+def create_main(locale=DEFAULT_LOCALE):
+    """About section, mobile tabs and the experience/academia columns"""
+    content, ui = content_for(locale), LOCALES[locale]
+    return Main(
+        # Who I Am Section
+        Section(
+            H2(content["about"].title, cls="section-header"),
+            Div(
+                LazyChildren(create_paragraph, content["about"].paragraphs, store="paragraph"),
+                cls="about-content"
+            ),
+            id="about"
+        ),
+
+        # Experience Section (no section header, just tabs and columns)
+        Section(
+            # Mobile Tabs
+            Div(
+                Div(
+                    Button(content["about"].title, cls="tab-button active", **{"data-tab": "tab-about"}),
+                    Button(ui["built"], cls="tab-button", **{"data-tab": "tab-experience"}),
+                    Button(ui["academia"], cls="tab-button", **{"data-tab": "tab-academia"}),
+                    cls="tab-buttons"
+                ),
+                cls="mobile-tabs"
+            ),
+
+            Div(
+                # Mobile Tab Content - Who I Am
+                Div(
+                    LazyChildren(create_paragraph, content["about"].paragraphs, store="paragraph"),
+                    cls="tab-content active about-content",
+                    id="tab-about"
+                ),
+
+                # Two-Column Layout: side by side on desktop, and
+                # each column is a tab pane on mobile, so every card
+                # is rendered once. Nerdy Mode replaces the columns
+                # marked nerdy-replaced with their nerdy- counterpart
+                Div(
+                    # Left Column - What I've Built
                     Div(
-                        Div(
-                            Span("Nerdy Mode", cls="toggle-label"),
-                            Div(cls="toggle-switch", id="nerdyToggle"),
-                            style="display: flex; align-items: center; gap: 12px;"
-                        ),
-                        cls="footer-toggles"
+                        H3(ui["built"]),
+                        LazyChildren(create_job_card, content["experience"], store="job-card"),
+                        cls="column nerdy-replaced",
+                        id="tab-experience"
                     ),
+                    # Right Column - Academia & Community
+                    Div(
+                        H3(ui["academia"]),
+                        LazyChildren(create_academia_card, content["academia"], store="academia-card"),
+                        cls="column",
+                        id="tab-academia"
+                    ),
+                    cls="two-column",
+                    id="experienceContent"
                 ),
-                
-                cls="container"
             ),
-            create_script()
-        )
+            id="experience"
+        ),
     )
 
 
+def create_footer_toggles(locale=DEFAULT_LOCALE):
+    """Nerdy Mode toggle, pointing at the locale's fragment it loads and its file:// fallback"""
+    return Div(
+        Div(
+            Span(LOCALES[locale]["nerdy_mode"], cls="toggle-label"),
+            Div(cls="toggle-switch", id="nerdyToggle",
+                **{"data-src": f"{NERDY_FILE}?v={_digest(render_nerdy_fragment(locale))[:12]}",
+                   "data-script": f"{NERDY_SCRIPT_FILE}?v={_digest(render_nerdy_script(locale))[:12]}"}),
+            style="display: flex; align-items: center; gap: 12px;"
+        ),
+        cls="footer-toggles"
+    )
+
+
+def create_locale_links(theme_key, locale):
+    """Links to the same theme page in every locale the site is built in"""
+    here = posixpath.dirname(output_filename(theme_key, locale)) or "."
+    return Nav(
+        *(A(LOCALES[other]["name"], hreflang=other,
+            href=posixpath.relpath(output_filename(theme_key, other), here),
+            **({"aria-current": "page"} if other == locale else {}))
+          for other in site_locales()),
+        cls="locale-links"
+    )
+
+
+def generate_page(theme_key, locale=DEFAULT_LOCALE):
+    """
+    Generate a complete HTML page for a theme in a locale. Only the theme's
+    custom properties and the footer's theme label and locale links differ
+    between the pages of the matrix; everything else is a Fragment, built
+    and serialized once per build. The locale's text is in the header, main
+    and footer-toggles fragments; the head's script, styles and links are
+    shared by every locale.
+    """
+    root = site_root(locale)
+    body = Body(
+        Div(
+            Fragment(f"header:{locale}", partial(create_header, locale)),
+            Fragment(f"main:{locale}", partial(create_main, locale)),
+
+            # Footer with toggles
+            Footer(
+                P(f"{LOCALES[locale]['theme']}: {THEMES[theme_key]['name']}",
+                  style="color: var(--text-secondary); font-size: 14px;"),
+                create_locale_links(theme_key, locale) if len(site_locales()) > 1 else None,
+                Fragment(f"footer-toggles:{locale}", partial(create_footer_toggles, locale)),
+            ),
+
+            cls="container"
+        ),
+        Fragment(f"script:{root}", partial(create_script, root))
+    )
+
+    return Html(
+        Head(
+            Meta(charset="UTF-8"),
+            Meta(name="viewport", content="width=device-width, initial-scale=1.0"),
+            Title("Hernán Barijhoff"),
+            Fragment("theme-script", create_theme_script),
+            # The rules are computed once per set of names in critical_css
+            Fragment(f"critical-style:{locale}", partial(create_critical_style, body)),
+            StoredFragment("theme-style", create_style, theme_key, key=THEMES[theme_key]),
+            Fragment(f"stylesheet-link:{root}", partial(create_stylesheet_link, root)),
+        ),
+        body,
+        lang=locale,
+        data_theme=DEFAULT_COLOR_SCHEME
+    )
+
+
+def output_filename(theme_key, locale=DEFAULT_LOCALE):
+    """File a theme page is written to"""
+    # Use index.html for slate_blue (main theme for GitHub Pages)
+    if theme_key == "slate_blue":
+        return locale_path(locale, "index.html")
+    return locale_path(locale, f"design-{theme_key}.html")
+
+
+def render_page(theme_key, locale=DEFAULT_LOCALE):
+    """Render a theme page to the exact bytes written to disk, splicing in the cached fragments"""
+    return f"<!DOCTYPE html>\n{''.join(iter_xml(generate_page(theme_key, locale)))}".encode("utf-8")
+
+
+def _has_element_children(elm):
+    return any(isinstance(c, (FT, tuple, list, LazyChildren)) or hasattr(c, '__ft__') for c in elm.children)
+
+
+# A block element with a text child that can't occur in a page. iter_xml has
+# to_xml render each element it walks with this as the only child; the
+# output around it is the element's own markup, and the marker's indentation
+# shows the level and indent its real children are rendered at.
+_CHILD_MARKER = Div("\x00")
+_CHILD_MARKER_XML = "<div>\x00</div>"
+
+
+def _element_markup(elm, lvl, indent):
+    """to_xml's markup before and after elm's children, and the lvl and indent the children get"""
+    xml = to_xml(FT(elm.tag, (_CHILD_MARKER,), elm.attrs, void_=elm.void_), lvl=lvl, indent=indent)
+    before, _, after = xml.partition(_CHILD_MARKER_XML)
+    opening = before.rstrip(" ")
+    child_indent = after.startswith("\n")
+    return opening, after[1:] if child_indent else after, len(before) - len(opening), child_indent
+
+
+def iter_xml(elm, lvl=0, indent=True, splice=True):
+    """
+    Serialize an FT tree as a stream of string chunks that join to to_xml(elm).
+    Elements holding other elements are walked here, with their own markup
+    taken from to_xml; everything below that is handed to to_xml whole.
+    With splice, Fragments come out of FRAGMENT_CACHE as one chunk; without,
+    they are walked like any other tree, so nothing large is kept around.
+    StoredFragments (cards, paragraphs, theme styles) always come from
+    FRAGMENT_STORE.
+    """
+    if isinstance(elm, Fragment) and splice:
+        yield elm.serialize(lvl, indent)
+        return
+    if isinstance(elm, StoredFragment):
+        yield FRAGMENT_STORE.fetch(elm, lvl, indent)
+        return
+    if isinstance(elm, LazyChildren):
+        for child in elm:
+            yield from iter_xml(child, lvl, indent, splice)
+        return
+    if hasattr(elm, '__ft__'):
+        elm = elm.__ft__()
+    if isinstance(elm, (tuple, list)):
+        for child in elm:
+            yield from iter_xml(child, lvl, indent, splice)
+        return
+    if not isinstance(elm, FT) or not _has_element_children(elm):
+        # In a 1-tuple, so to_xml escapes text as it does inside an element
+        yield to_xml((elm,), lvl=lvl, indent=indent)
+        return
+
+    opening, closing, child_lvl, child_indent = _element_markup(elm, lvl, indent)
+    yield opening
+    for child in elm.children:
+        yield from iter_xml(child, lvl=child_lvl, indent=child_indent, splice=splice)
+    yield closing
+
+
+def write_page(theme_key, f, locale=DEFAULT_LOCALE):
+    """
+    Stream a theme page into the binary file f, chunk by chunk, and return
+    the number of bytes written. Memory stays flat however many cards the
+    content has; the bytes match render_page.
+    """
+    written = f.write(b"<!DOCTYPE html>\n")
+    for chunk in iter_xml(generate_page(theme_key, locale), splice=False):
+        written += f.write(chunk.encode("utf-8"))
+    return written
+
+
+_ELEMENT_RE = re.compile(r"<[a-zA-Z]")
+_TEXT_NODE_RE = re.compile(r">[^<]*[^<\s][^<]*<")
+
+
+def count_nodes(xml):
+    """Number of DOM nodes (elements and non-blank text) in serialized markup"""
+    return len(_ELEMENT_RE.findall(xml)) + len(_TEXT_NODE_RE.findall(xml))
+
+
+# Minification - an optional post-render stage, chosen by file extension.
+# Strings and comments are matched first so nothing inside a string is touched.
+_CSS_SKIP_RE = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')|/\*.*?\*/""", re.S)
+_JS_SKIP_RE = re.compile(r"""("(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)|//[^\n]*|/\*.*?\*/""", re.S)
+_HTML_TOKEN_RE = re.compile(r"<!--.*?-->|<(script|style|pre|textarea)\b([^>]*)>(.*?)</\1\s*>|<[^>]+>", re.S | re.I)
+_TAG_NAME_RE = re.compile(r"</?([!a-zA-Z0-9]+)")
+# Whitespace next to these tags never renders, so it can be dropped
+_BLOCK_TAGS = {
+    "!doctype", "html", "head", "body", "title", "meta", "link", "style", "script", "template",
+    "div", "p", "ul", "ol", "li", "h1", "h2", "h3", "h4", "h5", "h6", "header", "footer",
+    "main", "section", "nav", "article", "aside", "table", "thead", "tbody", "tr", "td", "th",
+    "form", "br", "hr",
+}
+
+
+def _minify_code(code, skip_re, squeeze):
+    """Apply squeeze to everything outside strings and comments; comments are dropped"""
+    out = []
+    pending = []
+    pos = 0
+    for m in skip_re.finditer(code):
+        pending.append(code[pos:m.start()])
+        pos = m.end()
+        if m.group(1):
+            out.append(squeeze("".join(pending)))
+            out.append(m.group(1))
+            pending = []
+        elif m.group().startswith("/*"):
+            pending.append(" ")
+    pending.append(code[pos:])
+    out.append(squeeze("".join(pending)))
+    return "".join(out).strip()
+
+
+def _squeeze_css(code):
+    code = re.sub(r"\s+", " ", code)
+    code = re.sub(r" ?([{};,>]) ?", r"\1", code)
+    code = code.replace(": ", ":")
+    return code.replace(";}", "}")
+
+
+def _squeeze_js(code):
+    # Newlines are kept, so automatic semicolon insertion still sees them
+    code = re.sub(r"[ \t]+", " ", code)
+    return re.sub(r" ?\n\s*", "\n", code)
+
+
+def minify_css(css):
+    """Drop comments and the whitespace around CSS punctuation"""
+    return _minify_code(css, _CSS_SKIP_RE, _squeeze_css)
+
+
+def minify_js(js):
+    """Drop comments, indentation and blank lines; assumes no regex literals"""
+    return _minify_code(js, _JS_SKIP_RE, _squeeze_js)
+
+
+def minify_html(html):
+    """
+    Collapse whitespace between tags and minify inline <style>/<script>.
+    Text runs become a single space, and whitespace touching a block-level
+    tag is removed; <pre> and <textarea> are kept verbatim.
+    """
+    out = []
+    texts = []  # (index in out, text) to trim once the neighbouring tags are known
+    prev_block = True
+    pos = 0
+    for m in _HTML_TOKEN_RE.finditer(html):
+        text = html[pos:m.start()]
+        token = m.group()
+        pos = m.end()
+        if token.startswith("<!--"):
+            continue
+        name = _TAG_NAME_RE.match(token).group(1).lower()
+        block = name in _BLOCK_TAGS
+        if text:
+            text = re.sub(r"\s+", " ", text)
+            if prev_block:
+                text = text.lstrip()
+            if block:
+                text = text.rstrip()
+            out.append(text)
+        if m.group(1):
+            tag, attrs, body = m.group(1), m.group(2), m.group(3)
+            if tag.lower() == "style":
+                body = minify_css(body)
+            elif tag.lower() == "script":
+                body = minify_js(body)
+            token = f"<{tag}{attrs}>{body}</{tag}>"
+        out.append(token)
+        prev_block = block
+    tail = re.sub(r"\s+", " ", html[pos:])
+    out.append(tail.strip())
+    return "".join(out)
+
+
+_MINIFIERS = {".html": minify_html, ".css": minify_css, ".js": minify_js}
+
+
+def minify_output(filename, data):
+    """Minify rendered bytes according to the file extension"""
+    minifier = _MINIFIERS.get(Path(filename).suffix)
+    if minifier is None:
+        return data
+    return minifier(data.decode("utf-8")).encode("utf-8")
+
+
+# Precompressed siblings (index.html.gz, ...) for hosts that serve them
+# directly. brotli and zstd are used when their modules are installed.
+COMPRESSORS = {".gz": lambda data: gzip.compress(data, compresslevel=9, mtime=0)}
+if brotli is not None:
+    COMPRESSORS[".br"] = lambda data: brotli.compress(data, quality=11)
+if zstandard is not None:
+    COMPRESSORS[".zst"] = lambda data: zstandard.ZstdCompressor(level=19).compress(data)
+
+
+# Every extension a build may have written, whichever modules it had
+COMPRESSED_EXTENSIONS = (".gz", ".br", ".zst")
+
+
+def write_compressed(filename, entry):
+    """
+    Write every COMPRESSORS variant of filename next to it.
+    entry is the file's manifest entry; it records which output hash each
+    variant was made from, so unchanged files are not compressed again.
+    Returns {extension: compressed size}.
+    """
+    prune_compressed(filename, entry, keep=COMPRESSORS)
+    done = entry.setdefault("compressed", {})
+    data = None
+    sizes = {}
+    for ext, compress in COMPRESSORS.items():
+        path = Path(filename + ext)
+        if done.get(ext) != entry["output"] or not path.exists():
+            if data is None:
+                data = Path(filename).read_bytes()
+            path.write_bytes(compress(data))
+            done[ext] = entry["output"]
+        sizes[ext] = path.stat().st_size
+    return sizes
+
+
+def prune_compressed(filename, entry, keep=()):
+    """
+    Delete the variants of filename that no longer match its output, so a
+    host serving precompressed files never sends an old page. Variants in
+    keep that match the output hash recorded in entry are left alone.
+    """
+    done = entry.get("compressed", {})
+    for ext in COMPRESSED_EXTENSIONS:
+        if ext in keep and done.get(ext) == entry["output"]:
+            continue
+        Path(filename + ext).unlink(missing_ok=True)
+        done.pop(ext, None)
+    if not done:
+        entry.pop("compressed", None)
+
+
+def _init_worker(content_path, format_cache_size, fragment_store_bytes):
+    """
+    Worker initializer: load the parent's content file and apply its cache
+    settings. Workers started with spawn or forkserver re-import this module
+    and would otherwise build from the default content.
+    """
+    FORMAT_CACHE.resize(format_cache_size)
+    FRAGMENT_STORE.max_bytes = fragment_store_bytes
+    if Path(content_path) != CONTENT_SOURCES[0]:
+        use_content(content_path)
+
+
+def _render_timed(target, minify=False, stream=False):
+    """
+    Worker entry point: render one output file and measure how long it took.
+    Returns (filename, bytes, seconds, size before minification). With
+    stream, pages are written straight to a temporary file next to the
+    output and its Path is returned instead of the bytes.
+    """
+    filename, render, args, _ = target
+    start = time.perf_counter()
+    if stream and render is render_page:
+        theme_key, locale = args
+        path = Path(filename + ".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            size = write_page(theme_key, f, locale)
+        return filename, path, time.perf_counter() - start, size
+    data = render(*args)
+    size = len(data)
+    if minify:
+        data = minify_output(filename, data)
+    return filename, data, time.perf_counter() - start, size
+
+
+# Generator functions and methods timed by --profile, as build stages. Pages
+# are serialized by iter_xml, which splices cached fragments in through
+# Fragment.serialize and FragmentStore.fetch
+PROFILED_FUNCTIONS = (
+    "parse_many", "format_text", "format_many", "create_job_card", "create_academia_card",
+    "create_nerdy_fragment", "create_header", "create_main", "create_footer_toggles",
+    "create_style", "create_script", "generate_page",
+    "iter_xml", "Fragment.serialize", "FragmentStore.fetch", "minify_output",
+)
+
+
+class Profiler:
+    """
+    Records nested build stages with their wall time and net retained blocks
+    (change in sys.getallocatedblocks: blocks allocated and still alive when
+    the stage ends, negative when it frees more than it keeps), grouped by
+    the output file being built. Exports a summary table and a Chrome
+    trace-event JSON.
+    """
+
+    def __init__(self):
+        self.events = []  # (name, file, start, seconds, retained)
+        self.file = None
+        self._origin = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name, file=None):
+        outer_file = self.file
+        if file is not None:
+            self.file = file
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.events.append((name, self.file, start - self._origin, time.perf_counter() - start,
+                                sys.getallocatedblocks() - blocks))
+            self.file = outer_file
+
+    @contextmanager
+    def instrumented(self, namespace, names=PROFILED_FUNCTIONS):
+        """
+        Temporarily replace namespace[name], or a Class.method in namespace,
+        with a wrapper that records a stage per call. A generator's stage lasts
+        until it is exhausted, and recursive calls count towards the outermost.
+        """
+        active = set()
+
+        def wrap(name, fn):
+            if inspect.isgeneratorfunction(fn):
+                @wraps(fn)
+                def wrapper(*args, **kwargs):
+                    if name in active:
+                        return (yield from fn(*args, **kwargs))
+                    active.add(name)
+                    try:
+                        with self.stage(name):
+                            return (yield from fn(*args, **kwargs))
+                    finally:
+                        active.discard(name)
+            else:
+                @wraps(fn)
+                def wrapper(*args, **kwargs):
+                    if name in active:
+                        return fn(*args, **kwargs)
+                    active.add(name)
+                    try:
+                        with self.stage(name):
+                            return fn(*args, **kwargs)
+                    finally:
+                        active.discard(name)
+            return wrapper
+
+        targets = []
+        for name in names:
+            owner, _, attr = name.rpartition(".")
+            owner = namespace[owner] if owner else None
+            targets.append((name, owner, attr, namespace[attr] if owner is None else getattr(owner, attr)))
+
+        def install(replace):
+            for name, owner, attr, fn in targets:
+                fn = replace(name, fn)
+                if owner is None:
+                    namespace[attr] = fn
+                else:
+                    setattr(owner, attr, fn)
+
+        install(wrap)
+        try:
+            yield
+        finally:
+            install(lambda name, fn: fn)
+
+    def summary(self):
+        """Per-file, per-stage table of calls, total time and net retained blocks"""
+        totals = {}
+        for name, file, _, seconds, retained in self.events:
+            row = totals.setdefault((file or "-", name), [0, 0.0, 0])
+            row[0] += 1
+            row[1] += seconds
+            row[2] += retained
+        lines = [f"{'File':<22} {'Stage':<22} {'Calls':>7} {'Total ms':>10} {'Net retained':>12}"]
+        for (file, name), (calls, seconds, retained) in sorted(totals.items(), key=lambda kv: (kv[0][0], -kv[1][1])):
+            lines.append(f"{file:<22} {name:<22} {calls:>7,} {seconds * 1e3:>10.2f} {retained:>12,}")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """The events in Chrome trace-event format (chrome://tracing, Perfetto)"""
+        pid = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {"name": name, "cat": "build", "ph": "X", "pid": pid, "tid": 0,
+                 "ts": round(start * 1e6, 3), "dur": round(seconds * 1e6, 3),
+                 "args": {"file": file, "net_retained_blocks": retained}}
+                for name, file, start, seconds, retained in self.events
+            ],
+        }
+
+
+def _no_stage(name, file=None):
+    return nullcontext()
+
+
+MANIFEST_FILE = ".build-manifest.json"
+
+
+def _record_json(record):
+    """Content records as JSON: their type name followed by their fields"""
+    return [type(record).__name__, *(getattr(record, field.name) for field in fields(record))]
+
+
+def _digest(data):
+    """sha256 of bytes, str, or any JSON-serializable value (content records included)"""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    elif not isinstance(data, bytes):
+        data = json.dumps(data, sort_keys=True, ensure_ascii=False, default=_record_json).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def _file_digest(path):
+    """sha256 of a file on disk, or None if it doesn't exist"""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(partial(f.read, 1 << 16), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+# Any edit to this file (layout, cards, markup) or to fasthtml changes every page
+GENERATOR_VERSION = _digest(Path(__file__).read_bytes() + fasthtml.__version__.encode())
+
+
+def build_targets():
+    """
+    Every output file of the build as (filename, render function, arguments,
+    input hashes). The render functions are module-level so they can be sent
+    to worker processes. The stylesheet, script and resume are built once;
+    the Nerdy Mode fragment once per locale and a page for every locale and
+    theme, locale by locale.
+    """
+    shared = {"style": _digest(SITE_CSS), "generator": GENERATOR_VERSION}
+    locales = site_locales()
+    targets = [(SITE_CSS_FILE, render_site_css, (), shared)]
+    targets.append((RESUME_FILE, render_resume_experience, (),
+                    {"content": _digest(CONTENT), "generator": GENERATOR_VERSION}))
+    theme_style = _digest(THEME_TEMPLATE)
+    script = _digest(SITE_JS)
+    targets.append((SITE_JS_FILE, render_site_js, (), {"script": script, "generator": GENERATOR_VERSION}))
+    for locale in locales:
+        content = content_for(locale)
+        nerdy = _digest(content["nerdy"])
+        targets.append((locale_path(locale, NERDY_FILE), render_nerdy_fragment, (locale,),
+                        {"nerdy": nerdy, "generator": GENERATOR_VERSION}))
+        targets.append((locale_path(locale, NERDY_SCRIPT_FILE), render_nerdy_script, (locale,),
+                        {"nerdy": nerdy, "generator": GENERATOR_VERSION}))
+        content = _digest(content)
+        for theme_key in THEMES:
+            inputs = {
+                **shared,
+                "content": content,
+                "nerdy": nerdy,
+                "locales": locales,
+                "theme": _digest(THEMES[theme_key]),
+                "theme_style": theme_style,
+                "script": script,
+                "theme_script": _digest(THEME_SCRIPT),
+            }
+            targets.append((output_filename(theme_key, locale), render_page, (theme_key, locale), inputs))
+    return targets
+
+
+def load_manifest():
+    """Read the manifest of the last build; a missing or broken one means rebuild everything"""
+    try:
+        return json.loads(Path(MANIFEST_FILE).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_manifest(manifest):
+    Path(MANIFEST_FILE).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+LINK_CACHE_FILE = CONTENT_CACHE_DIR / "links.json"
+LINK_CACHE_TTL = 24 * 3600   # seconds a reachable external URL isn't checked again
+LINK_CONCURRENCY = 16        # external requests in flight at once
+LINK_HOST_INTERVAL = 0.5     # seconds between requests to the same host
+LINK_TIMEOUT = 10            # seconds per request
+LINK_MAX_REDIRECTS = 5
+# The server answered but turns crawlers away (LinkedIn's 999), so the URL itself is fine
+LINK_BLOCKED_STATUSES = {429, 999}
+
+# Attributes holding a link; data-tab names the id of the pane a tab button shows
+LINK_ATTRS = ("href", "src", "data-src", "data-script", "data-tab")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
+def collect_links(tree):
+    """
+    Every (attribute, value) link and every id in an FT tree, in document
+    order. Fragments and lazy children are expanded in memory; nothing is
+    serialized.
+    """
+    links, ids = [], set()
+    stack = [tree]
+    while stack:
+        elm = stack.pop()
+        if isinstance(elm, FT):
+            links.extend((attr, elm.attrs[attr]) for attr in LINK_ATTRS if attr in elm.attrs)
+            if "id" in elm.attrs:
+                ids.add(elm.attrs["id"])
+            stack.extend(reversed(elm.children))
+        elif hasattr(elm, "__ft__"):
+            stack.append(elm.__ft__())
+        elif isinstance(elm, (tuple, list, LazyChildren)):
+            stack.extend(reversed(list(elm)))
+    return links, ids
+
+
+class LinkChecker:
+    """
+    Checks external http(s) URLs concurrently on one asyncio loop, with
+    HEAD requests (GET when a server doesn't allow HEAD). Connections are
+    kept alive and pooled per host, at most `concurrency` requests are in
+    flight, requests to the same host start at least `host_interval`
+    seconds apart, and reachable URLs are cached in cache_file for `ttl`
+    seconds. Failures are never cached, so they are retried on every run.
+    """
+
+    def __init__(self, cache_file=LINK_CACHE_FILE, ttl=LINK_CACHE_TTL, concurrency=LINK_CONCURRENCY,
+                 host_interval=LINK_HOST_INTERVAL, timeout=LINK_TIMEOUT):
+        self.cache_file = Path(cache_file)
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.host_interval = host_interval
+        self.timeout = timeout
+        self.cached = 0       # URLs answered from the cache
+        self.requests = 0     # requests sent
+        self.connections = 0  # connections opened
+
+    def check(self, urls):
+        """{url: None if it is reachable, else why not} for every url"""
+        try:
+            cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            cache = {}
+        now = time.time()
+        results, todo = {}, []
+        for url in dict.fromkeys(urls):
+            if now - cache.get(url, -math.inf) < self.ttl:
+                results[url] = None
+                self.cached += 1
+            else:
+                todo.append(url)
+        if todo:
+            errors = asyncio.run(self._check_all(todo))
+            for url, error in zip(todo, errors):
+                results[url] = error
+                if error is None:
+                    cache[url] = now
+            cache = {url: checked for url, checked in cache.items() if now - checked < self.ttl}
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        return results
+
+    async def _check_all(self, urls):
+        self._idle = {}        # (scheme, host, port) -> connections ready for another request
+        self._open = set()     # every writer, closed once all checks are done
+        self._next_start = {}  # host -> loop time its next request may start
+        self._started = {}     # host -> loop time its last request was sent
+        self._slots = asyncio.Semaphore(self.concurrency)
+        try:
+            return await asyncio.gather(*(self._check(url) for url in urls))
+        finally:
+            for writer in self._open:
+                writer.close()
+
+    async def _check(self, url):
+        method = "HEAD"
+        for _ in range(LINK_MAX_REDIRECTS + 1):
+            try:
+                status, location = await self._request(method, url)
+            except asyncio.TimeoutError:
+                return f"no answer in {self.timeout}s"
+            except (OSError, EOFError, ValueError, asyncio.LimitOverrunError) as e:
+                return f"{type(e).__name__}: {e}"
+            if status in (405, 501) and method == "HEAD":
+                method = "GET"
+            elif status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+            elif status < 400 or status in LINK_BLOCKED_STATUSES:
+                return None
+            else:
+                return f"HTTP {status}"
+        return f"more than {LINK_MAX_REDIRECTS} redirects"
+
+    async def _request(self, method, url):
+        """
+        (status, Location header) of one request, on a pooled connection when
+        there is one. Waiting for the host's turn and for a free slot doesn't
+        count towards the timeout; only connecting and the exchange do.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"not an http(s) URL: {url}")
+        host = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == "https" else 80))
+        # Reserve this host's next start time before waiting, so concurrent checks queue up
+        loop = asyncio.get_running_loop()
+        start = max(loop.time(), self._next_start.get(parts.hostname, 0))
+        self._next_start[parts.hostname] = start + self.host_interval
+        await asyncio.sleep(start - loop.time())
+        target = parts.path or "/"
+        if parts.query:
+            target += f"?{parts.query}"
+        request = (f"{method} {target} HTTP/1.1\r\nHost: {parts.netloc.rpartition('@')[2]}\r\n"
+                   f"User-Agent: link-checker ({Path(__file__).name})\r\nAccept: */*\r\n\r\n").encode("ascii")
+        async with self._slots:
+            # Requests that waited for a slot can get one back to back; space them again
+            while (delay := self._started.get(parts.hostname, -math.inf) + self.host_interval - loop.time()) > 0:
+                await asyncio.sleep(delay)
+            self._started[parts.hostname] = loop.time()
+            return await asyncio.wait_for(self._send(host, request, method), self.timeout)
+
+    async def _send(self, host, request, method):
+        idle = self._idle.setdefault(host, [])
+        while idle:
+            reader, writer = idle.pop()
+            try:
+                return await self._exchange(host, reader, writer, request, method)
+            except (OSError, EOFError):
+                # The server closed the kept-alive connection; try the next one
+                writer.close()
+                self._open.discard(writer)
+        reader, writer = await asyncio.open_connection(
+            host[1], host[2], ssl=ssl.create_default_context() if host[0] == "https" else None)
+        self.connections += 1
+        self._open.add(writer)
+        return await self._exchange(host, reader, writer, request, method)
+
+    async def _exchange(self, host, reader, writer, request, method):
+        self.requests += 1
+        writer.write(request)
+        await writer.drain()
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        version, status, *_ = head[0].split(" ", 2)
+        headers = {name.lower(): value for name, _, value in (line.partition(": ") for line in head[1:])}
+        # A HEAD response has no body, so the connection is ready for the next request.
+        # GET is only a fallback; its body isn't worth reading, so that connection is dropped
+        if method == "HEAD" and version == "HTTP/1.1" and headers.get("connection", "").lower() != "close":
+            self._idle[host].append((reader, writer))
+        else:
+            writer.close()
+            self._open.discard(writer)
+        return int(status), headers.get("location")
+
+
+def check_links(checker=None):
+    """
+    Check the links of every page of the locale x theme matrix, with the
+    Nerdy Mode fragment that gets inserted into it. Anchors (href="#…" and
+    data-tab targets) must name an id on the page, relative links (resolved
+    from the page's directory) an output of the build or a file on disk,
+    and mailto links a well-formed address; http(s) URLs are checked by
+    checker, or skipped without one.
+    Returns (problems, counts): problems is a list of (page, link, reason)
+    and counts has the number of "internal" and "external" links checked.
+    """
+    outputs = {filename for filename, _, _, _ in build_targets()}
+    problems, external = [], {}  # external: url -> pages linking to it
+    internal = 0
+    for locale, theme_key in itertools.product(site_locales(), THEMES):
+        page = output_filename(theme_key, locale)
+        links, ids = collect_links((generate_page(theme_key, locale), create_nerdy_fragment(locale)))
+        for attr, value in links:
+            if attr == "data-tab":
+                value = f"#{value}"
+            parts = urlsplit(value)
+            if parts.scheme in ("http", "https"):
+                external.setdefault(value, []).append(page)
+                continue
+            if parts.scheme == "mailto":
+                error = None if _EMAIL_RE.fullmatch(parts.path) else "malformed address"
+            elif parts.scheme:
+                continue  # tel:, data: and the like can't be checked
+            elif value.startswith("#"):
+                error = None if value == "#" or value[1:] in ids else "no element with this id"
+            else:
+                path = posixpath.normpath(posixpath.join(posixpath.dirname(page), parts.path))
+                error = None if path in outputs or os.path.exists(path) else "no such file"
+            internal += 1
+            if error:
+                problems.append((page, value, error))
+    if checker and external:
+        for url, error in checker.check(external).items():
+            if error:
+                pages = external[url]
+                where = pages[0] if len(pages) == 1 else f"{pages[0]} and {len(pages) - 1} more"
+                problems.append((where, url, error))
+    return problems, {"internal": internal, "external": len(external) if checker else 0}
+
+
+def build(jobs=1, force=False, minify=False, compress=False, stream=False, profile=None, links=None):
+    """
+    Render the shared stylesheet and every theme page and write them to disk.
+    THEMES are validated first, raising ThemeError. Outputs whose inputs match the manifest of the previous build, and whose
+    file on disk is still the one that build wrote, are skipped entirely;
+    force ignores the manifest. Rendered files that come out identical to
+    the file on disk are not rewritten, so mtimes stay stable.
+    With jobs > 1 the outputs are rendered in a process pool; workers return
+    the serialized bytes and the parent writes them, so the files are
+    identical to a serial build. minify runs every output through the
+    HTML/CSS/JS minifiers and reports the size before and after.
+    compress writes a .gz (and .br/.zst when available) next to every output;
+    without it, variants left by an earlier build are deleted.
+    stream writes pages chunk by chunk instead of holding them in memory
+    (it can't be combined with minify, which needs the whole document).
+    profile is a path: every stage is timed per output file, a summary table
+    is printed and a Chrome trace is written there. Profiling renders
+    serially so the stages are not interleaved.
+    links adds a check-links stage: "internal" checks anchors, local files
+    and mailto addresses, "all" also requests every external URL. Returns
+    the broken links as (page, link, reason).
+    """
+    validate_themes(THEMES)
+    profiler = Profiler() if profile else None
+    stage = profiler.stage if profiler else _no_stage
+    if profiler:
+        jobs = 1
+    start = time.perf_counter()
+    FRAGMENT_CACHE.clear()
+    FRAGMENT_STORE.reset_stats()
+    manifest = load_manifest()
+    targets = build_targets()
+
+    stale = []
+    for target in targets:
+        filename, _, _, inputs = target
+        inputs["minify"] = minify
+        entry = manifest.get(filename)
+        if not force and entry and entry["inputs"] == inputs and entry["output"] == _file_digest(filename):
+            print(f"⏭️  Unchanged {filename}")
+        else:
+            stale.append(target)
+
+    render = partial(_render_timed, minify=minify, stream=stream)
+    pooled = jobs > 1 and len(stale) > 1
+    render_start = time.perf_counter()
+    if pooled:
+        init = (CONTENT_SOURCES[0], FORMAT_CACHE.max_entries, FRAGMENT_STORE.max_bytes)
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=init) as pool:
+            rendered = list(pool.map(render, stale))
+    else:
+        rendered = []
+        with profiler.instrumented(globals()) if profiler else nullcontext():
+            for target in stale:
+                with stage("render", target[0]):
+                    rendered.append(render(target))
+    render_wall = time.perf_counter() - render_start
+
+    for (filename, data, seconds, size), (_, _, _, inputs) in zip(rendered, stale):
+        streamed = isinstance(data, Path)
+        output = _file_digest(data) if streamed else _digest(data)
+        note = f" ({size:,} → {len(data):,} bytes, {len(data) / size - 1:+.0%})" if minify else ""
+        if output == _file_digest(filename):
+            if streamed:
+                data.unlink()
+            print(f"✅ Generated {filename}{note} (identical, not rewritten)")
+        else:
+            with stage("write", filename):
+                if streamed:
+                    os.replace(data, filename)
+                else:
+                    Path(filename).parent.mkdir(parents=True, exist_ok=True)
+                    with open(filename, 'wb') as f:
+                        f.write(data)
+            print(f"✅ Generated {filename}{note}")
+        # Keep the record of compressed variants; they are checked against the output hash
+        manifest[filename] = {**manifest.get(filename, {}), "inputs": inputs, "output": output}
+        if not pooled and not profiler:
+            # What a pooled build of this file is compared with
+            manifest[filename]["serial_seconds"] = seconds
+
+    if compress:
+        for filename, _, _, _ in targets:
+            if Path(filename).suffix not in _MINIFIERS:
+                continue  # only web assets are served compressed
+            with stage("compress", filename):
+                sizes = write_compressed(filename, manifest[filename])
+            details = ", ".join(f"{ext} {size:,}" for ext, size in sizes.items())
+            print(f"🗜️  {filename}: {os.path.getsize(filename):,} bytes → {details}")
+    else:
+        # Variants from an earlier --compress build would go stale with their output
+        for filename, _, _, _ in targets:
+            prune_compressed(filename, manifest[filename], keep=COMPRESSED_EXTENSIONS)
+    save_manifest(manifest)
+    evicted = FRAGMENT_STORE.evict()
+
+    wall = time.perf_counter() - start
+    render_time = sum(seconds for _, _, seconds, _ in rendered)
+    # Summed render time over wall time is how many renders ran at once on average
+    print(f"Rendered {len(rendered)} of {len(targets)} files with {jobs} job(s) in {wall:.3f}s wall "
+          f"({render_time:.3f}s of rendering summed over jobs, average render concurrency {render_time / wall:.2f})")
+    if pooled:
+        # The speedup compares the pool's wall time with the last serial render of the same files
+        serial = [manifest[filename].get("serial_seconds") for filename, _, _, _ in stale]
+        if None in serial:
+            print("Speedup: build once with --jobs 1 to record the serial render times to compare with")
+        else:
+            print(f"Speedup: {sum(serial) / render_wall:.2f}x ({render_wall:.3f}s rendering in {jobs} jobs, "
+                  f"{sum(serial):.3f}s in the last --jobs 1 build)")
+    # Work shared across the locale x theme matrix is done by the first page
+    # that needs it, so the pages after it should be cheaper
+    pages = [seconds for (_, render, _, _), (_, _, seconds, _) in zip(stale, rendered) if render is render_page]
+    if pages:
+        later = f", then {sum(pages[1:]) / (len(pages) - 1) * 1e3:.1f} ms per page" if len(pages) > 1 else ""
+        print(f"Matrix: {len(site_locales())} locale(s) x {len(THEMES)} theme(s), {len(pages)} page(s) rendered "
+              f"in {sum(pages) * 1e3:.1f} ms: first {pages[0] * 1e3:.1f} ms{later}")
+    if jobs == 1:
+        # Workers keep their own caches, so only a serial build has meaningful totals
+        print(f"Format cache: {FORMAT_CACHE.stats()}")
+        print(f"Fragment cache: {FRAGMENT_CACHE.stats()}")
+        print(f"Fragment store: {FRAGMENT_STORE.stats()}")
+    if evicted:
+        print(f"Fragment store: evicted {evicted} least recently used fragment(s) to stay under "
+              f"{FRAGMENT_STORE.max_bytes / 2**20:.3g} MB")
+
+    # Pages used to carry a second copy of every card for the mobile tabs.
+    # The cards' markup comes from the fragment store, so this renders nothing new
+    card_count = card_bytes = card_nodes = 0
+    for card in itertools.chain(LazyChildren(create_job_card, CONTENT["experience"], store="job-card"),
+                                LazyChildren(create_academia_card, CONTENT["academia"], store="academia-card")):
+        xml = FRAGMENT_STORE.fetch(card, 0, True)
+        card_count += 1
+        card_bytes += len(xml.encode("utf-8"))
+        card_nodes += count_nodes(xml)
+    print(f"Cards: {card_count} rendered once per page instead of twice, saving "
+          f"{card_bytes:,} bytes and {card_nodes:,} DOM nodes per page")
+
+    # Only the critical rules block the first paint; the rest of site.css loads
+    # in the background. Sizes are gzipped, as sent over the wire
+    css_bytes = len(gzip.compress(Path(SITE_CSS_FILE).read_bytes()))
+    for filename in (output_filename(theme_key, locale) for locale in site_locales() for theme_key in THEMES):
+        page = Path(filename).read_bytes()
+        first_render = len(gzip.compress(page))
+        critical = re.search(rb"<style>(.*?)</style>", page, re.S).group(1)
+        status = "✅" if first_render <= FIRST_RENDER_BUDGET else "⚠️ "
+        print(f"{status} First render: {filename} is {first_render:,} gzipped bytes (budget {FIRST_RENDER_BUDGET:,}) "
+              f"with {len(critical):,} bytes of critical CSS inline; a blocking {SITE_CSS_FILE} "
+              f"would add {css_bytes:,} bytes and a round trip")
+
+    problems = []
+    if links:
+        checker = LinkChecker() if links == "all" else None
+        with stage("check-links"):
+            problems, counts = check_links(checker)
+        external = (f"{counts['external']} external ({checker.cached} cached, {checker.requests} requests "
+                    f"over {checker.connections} connections)" if checker else "external skipped")
+        status = "❌" if problems else "🔗"
+        print(f"{status} Links: {counts['internal']} internal, {external}, {len(problems)} broken")
+        for page, link, reason in problems:
+            print(f"   {page}: {link} - {reason}")
+
+    if profiler:
+        print(profiler.summary())
+        Path(profile).write_text(json.dumps(profiler.chrome_trace()), encoding="utf-8")
+        print(f"Chrome trace written to {profile} (open in chrome://tracing or ui.perfetto.dev)")
+    return problems
+
+
+def watch(host="127.0.0.1", port=5001, minify=False):
+    """
+    Serve the site from memory and rebuild it as the content files change.
+    The process stays warm, so an edit only re-renders the outputs whose
+    inputs changed, and the format cache skips the unchanged paragraphs.
+    Pages carry fasthtml's live-reload client, which reloads the browser
+    when its websocket is closed and reconnects; that is done after every
+    rebuild. Editing this script restarts the process, which the client
+    picks up the same way.
+    """
+    outputs = {}  # filename -> bytes served
+    built = {}    # filename -> input hashes of the bytes in outputs
+    sockets = set()
+    reload_js = to_xml(LiveReloadJs()).encode("utf-8")
+    generator = Path(__file__).resolve()
+
+    def rebuild():
+        changed = []
+        for filename, render, args, inputs in build_targets():
+            inputs["minify"] = minify
+            if built.get(filename) == inputs:
+                continue
+            data = render(*args)
+            if minify:
+                data = minify_output(filename, data)
+            outputs[filename] = data
+            built[filename] = inputs
+            if _digest(data) != _file_digest(filename):
+                Path(filename).parent.mkdir(parents=True, exist_ok=True)
+                Path(filename).write_bytes(data)
+            changed.append(filename)
+        return changed
+
+    async def live_reload(websocket):
+        await websocket.accept()
+        sockets.add(websocket)
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+        finally:
+            sockets.discard(websocket)
+
+    # The preview keeps no sessions; a throwaway key stops FastHTML writing .sesskey to the working directory
+    app = FastHTML(routes=[WebSocketRoute("/live-reload", endpoint=live_reload)], secret_key=os.urandom(16).hex())
+
+    @app.get("/{path:path}")
+    def serve_output(path: str):
+        filename = f"{path}index.html" if not path or path.endswith("/") else path
+        data = outputs.get(filename)
+        if data is None:
+            # A locale's pages are linked as /es/, but /es should land there too
+            if f"{path}/index.html" in outputs:
+                return RedirectResponse(f"/{path}/")
+            return Response("Not found", status_code=404)
+        media_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        if media_type == "text/html" and b"</body>" in data:
+            data = data.replace(b"</body>", reload_js + b"</body>", 1)
+        return Response(data, media_type=media_type)
+
+    def mtime(path):
+        try:
+            return path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    async def watch_files():
+        # Translations are looked up again on every reload, so watch where they would be
+        def content_mtimes():
+            source = CONTENT_SOURCES[0]
+            return [mtime(source), *(mtime(translation_path(source, locale))
+                                     for locale in LOCALES if locale != DEFAULT_LOCALE)]
+
+        content_seen, generator_seen = content_mtimes(), mtime(generator)
+        while True:
+            await asyncio.sleep(0.05)
+            if mtime(generator) != generator_seen:
+                print(f"🔁 {generator.name} changed, restarting")
+                os.execv(sys.executable, [sys.executable, *sys.argv])
+            if content_mtimes() == content_seen:
+                continue
+            content_seen = content_mtimes()
+            start = time.perf_counter()
+            try:
+                use_content(CONTENT_SOURCES[0])
+            except (OSError, ContentError) as e:
+                print(f"❌ {e}")
+                continue
+            changed = rebuild()
+            print(f"🔄 Rebuilt {', '.join(changed) or 'nothing'} in {(time.perf_counter() - start) * 1e3:.1f} ms")
+            if changed:
+                for websocket in list(sockets):
+                    await websocket.close()
+
+    async def serve():
+        server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        watcher = asyncio.create_task(watch_files())
+        try:
+            await server.serve()
+        finally:
+            watcher.cancel()
+
+    start = time.perf_counter()
+    changed = rebuild()
+    print(f"✅ Built {', '.join(changed)} in {(time.perf_counter() - start) * 1e3:.1f} ms")
+    print(f"👀 Watching {', '.join(map(str, CONTENT_SOURCES))} - serving http://{host}:{port}/")
+    asyncio.run(serve())
+
+
 # Generate all theme pages
 if __name__ == "__main__":
-    for theme_key in THEMES.keys():
-        html_content = to_xml(generate_page(theme_key))
-        # Use index.html for slate_blue (main theme for GitHub Pages)
-        if theme_key == "slate_blue":
-            filename = "index.html"
-        else:
-            filename = f"design-{theme_key}.html"
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(f"<!DOCTYPE html>\n{html_content}")
-        print(f"✅ Generated {filename}")
-        
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="render themes in N worker processes (0 = one per CPU)")
+    parser.add_argument("--format-cache-size", type=int, default=FORMAT_CACHE.max_entries,
+                        help="maximum number of formatted paragraphs kept in memory")
+    parser.add_argument("--fragment-store-size", type=float, default=FRAGMENT_STORE.max_bytes / 2**20,
+                        metavar="MB", help=f"maximum size of the on-disk fragment store in {FRAGMENT_STORE.directory}")
+    parser.add_argument("--minify", action="store_true",
+                        help="minify the generated HTML, CSS and JS")
+    parser.add_argument("--compress", action="store_true",
+                        help="also write max-level .gz (and .br/.zst if available) files")
+    parser.add_argument("--stream", action="store_true",
+                        help="stream pages to disk chunk by chunk to keep memory flat")
+    parser.add_argument("--profile", nargs="?", const="build-trace.json", metavar="TRACE",
+                        help="time every build stage and write a Chrome trace (default build-trace.json)")
+    parser.add_argument("--check-links", nargs="?", const="all", choices=["internal", "all"],
+                        help="check the pages' links after building; internal skips the network "
+                             f"(reachable URLs are cached in {LINK_CACHE_FILE} for {LINK_CACHE_TTL // 3600}h)")
+    parser.add_argument("--content", default=None, metavar="FILE",
+                        help=f"content file to build from (JSON, or TOML on Python 3.11+; default {CONTENT_FILE}); "
+                             "translations are read from <name>.<locale>.<ext> next to it")
+    parser.add_argument("--watch", action="store_true",
+                        help="serve the site with live reload and rebuild when the content changes")
+    parser.add_argument("--port", type=int, default=5001,
+                        help="port for --watch (default 5001)")
+    parser.add_argument("--force", action="store_true",
+                        help=f"ignore {MANIFEST_FILE} and render every page")
+    args = parser.parse_args()
+    if args.stream and args.minify:
+        parser.error("--stream can't be combined with --minify")
+    if args.jobs < 0:
+        parser.error("--jobs can't be negative")
+    if args.format_cache_size < 0:
+        parser.error("--format-cache-size can't be negative")
+    if args.fragment_store_size < 0:
+        parser.error("--fragment-store-size can't be negative")
+    FORMAT_CACHE.resize(args.format_cache_size)
+    FRAGMENT_STORE.max_bytes = int(args.fragment_store_size * 2**20)
+    try:
+        validate_themes(THEMES)
+    except ThemeError as e:
+        parser.exit(1, f"❌ {e}\n")
+    if args.content:
+        try:
+            use_content(args.content)
+        except (OSError, ContentError) as e:
+            parser.exit(1, f"❌ {e}\n")
+
+    if args.watch:
+        watch(port=args.port, minify=args.minify)
+    else:
+        problems = build(jobs=args.jobs or os.cpu_count(), force=args.force, minify=args.minify,
+                         compress=args.compress, stream=args.stream, profile=args.profile,
+                         links=args.check_links)
+        if problems:
+            sys.exit(1)
@@ -0,0 +1 @@
+window.nerdyFragment = "<div>\n  <div id=\"nerdy-about\">\n    <h3>\u2192 BEHIND THE SCIENTIST</h3>\n    <p>I'm obsessed with worlds\u2014both real and imagined.</p>\n    <p>\n<strong>Middle Earth shaped my worldview.</strong> LOTR taught me that small people can change history, that fellowship matters more than individual glory, and that the best adventures come from saying yes to the unexpected.    </p>\n    <p>\n<strong>Music taught me about the joy of everyday life.</strong> Music is my lifeline, daft punk my mantra. It\u2019s what keeps me connected to people    </p>\n    <p>\n<strong>Meditation revealed the gap between map and territory.</strong> Sitting still for hours showed me that consciousness is weirder than any system we built, maybe AI can help us with that. Also: most of what we think is \u201cI\u201d is just noise.    </p>\n    <p>\n<strong>Science is what reminds me to keep wondering.</strong> Space, stars, physics, are the fields that I would love to study in an infinite-time universe.    </p>\n  </div>\n  <div id=\"nerdy-timeline\">\n    <div id=\"nerdy-tab-experience\" class=\"column nerdy-column\">\n      <h3>A DIFFERENT TIMELINE</h3>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>LOTR Dreaming</h4>\n          </div>\n          <p class=\"job-date\">1990\u20142010</p>\n        </div>\n        <p class=\"job-description\">Fell in love with world-building, epic quests, and the idea that hobbits\u2014the smallest, most overlooked people\u2014could save the world.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Science &amp; Meditation Obsession</h4>\n          </div>\n          <p class=\"job-date\">2010\u20142020</p>\n        </div>\n        <p class=\"job-description\">Discovered computational neuroscience could explain consciousness. Meanwhile, sat still for hours trying to understand it from the inside.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Daft Punk Phase</h4>\n          </div>\n          <p class=\"job-date\">2015\u20142018</p>\n        </div>\n        <p class=\"job-description\">Random Access Memories changed everything. Realized electronic music isn't cold\u2014it's the most human thing we've made.</p>\n      </div>\n      <div class=\"job\">\n        <div class=\"job-header\">\n          <div class=\"academia-title-col\">\n            <h4>Building for Impact</h4>\n          </div>\n          <p class=\"job-date\">2020\u2014Present</p>\n        </div>\n        <p class=\"job-description\">Turned the existential angst into action. If reality is broken, let's fix it.</p>\n      </div>\n    </div>\n  </div>\n</div>\n";
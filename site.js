@@ -0,0 +1,141 @@
+// Deferred: the document has been parsed by the time this runs
+
+let isNerdy = false;
+
+// Dark Mode Toggle
+function initDarkMode() {
+    const darkModeToggle = document.getElementById('darkModeToggle');
+    const html = document.documentElement;
+
+    // data-theme was resolved in <head> before first paint
+    if (darkModeToggle) {
+        darkModeToggle.classList.toggle('active', html.getAttribute('data-theme') === 'dark');
+    }
+
+    if (darkModeToggle) {
+        darkModeToggle.addEventListener('click', () => {
+            const currentTheme = html.getAttribute('data-theme');
+            const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+
+            html.setAttribute('data-theme', newTheme);
+            localStorage.setItem('theme', newTheme);
+            darkModeToggle.classList.toggle('active', newTheme === 'dark');
+        });
+    }
+}
+
+// Nerdy Mode Toggle
+// The fragment is fetched and parsed once; its nodes are added next to
+// the normal content and switching modes only flips their `hidden`
+function initNerdyMode() {
+    const toggle = document.getElementById('nerdyToggle');
+    const aboutDiv = document.querySelector('.about-content');
+    const expColumn = document.querySelector('.two-column');
+
+    // Mobile tabs
+    const mobileAbout = document.getElementById('tab-about');
+
+    if (!toggle) return;
+
+    // Adds hidden nodes to a container; returns them with the children they
+    // replace (all of the container's own, unless given)
+    function attach(container, nodes, own) {
+        if (!container) return null;
+        own = own || [...container.children];
+        nodes.forEach(node => { node.hidden = true; });
+        container.append(...nodes);
+        return { own, nodes };
+    }
+
+    // The fragment's markup. Pages opened from file:// can't fetch it,
+    // but can still run a script that carries it
+    function fetchNerdy() {
+        if (location.protocol !== 'file:') {
+            return fetch(toggle.dataset.src).then(response => {
+                if (!response.ok) throw new Error(`${response.status} ${response.url}`);
+                return response.text();
+            });
+        }
+        return new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = toggle.dataset.script;
+            script.onload = () => resolve(window.nerdyFragment);
+            script.onerror = () => { script.remove(); reject(new Error(`Could not load ${script.src}`)); };
+            document.head.append(script);
+        });
+    }
+
+    // Fun content, loaded from the prebuilt fragment on first use
+    let nerdyContent = null;
+    function loadNerdy() {
+        if (!nerdyContent) {
+            nerdyContent = fetchNerdy()
+                .then(html => {
+                    const template = document.createElement('template');
+                    template.innerHTML = html;
+                    const about = [...template.content.getElementById('nerdy-about').children];
+                    const timeline = [...template.content.getElementById('nerdy-timeline').children];
+                    return [
+                        attach(mobileAbout, about.map(node => node.cloneNode(true))),
+                        attach(aboutDiv, about),
+                        // Only the experience column is swapped; on mobile the
+                        // academia tab keeps its cards
+                        attach(expColumn, timeline,
+                               expColumn && [...expColumn.querySelectorAll(':scope > .nerdy-replaced')]),
+                    ].filter(Boolean);
+                });
+            // Let the next click retry if the request failed
+            nerdyContent.catch(() => { nerdyContent = null; });
+        }
+        return nerdyContent;
+    }
+
+    toggle.addEventListener('click', async () => {
+        let groups;
+        try {
+            groups = await loadNerdy();
+        } catch (err) {
+            console.error('Could not load Nerdy Mode', err);
+            return;
+        }
+        isNerdy = !isNerdy;
+
+        for (const { own, nodes } of groups) {
+            own.forEach(node => { node.hidden = isNerdy; });
+            nodes.forEach(node => { node.hidden = !isNerdy; });
+        }
+        toggle.classList.toggle('active', isNerdy);
+        document.body.classList.toggle('nerdy', isNerdy);
+
+        // The columns are also the mobile tab panes
+        const activeTab = document.querySelector('.tab-button.active');
+        if (activeTab) showTab(activeTab.dataset.tab);
+
+        document.getElementById('about').scrollIntoView({ behavior: 'smooth' });
+    });
+}
+
+// Mobile Tabs
+// In Nerdy Mode a pane can have a nerdy- counterpart (the timeline column)
+function tabPane(tab) {
+    return (isNerdy && document.getElementById(`nerdy-${tab}`)) || document.getElementById(tab);
+}
+
+function showTab(targetTab) {
+    document.querySelectorAll('.tab-button').forEach(btn => {
+        const isTarget = btn.dataset.tab === targetTab;
+        btn.classList.toggle('active', isTarget);
+        const pane = tabPane(btn.dataset.tab);
+        if (pane) pane.classList.toggle('active', isTarget);
+    });
+}
+
+function initMobileTabs() {
+    document.querySelectorAll('.tab-button').forEach(button => {
+        button.addEventListener('click', () => showTab(button.dataset.tab));
+    });
+}
+
+initDarkMode();
+initNerdyMode();
+initMobileTabs();
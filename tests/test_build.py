@@ -0,0 +1,40 @@
+"""Full builds in a scratch directory"""
+
+import gzip
+from pathlib import Path
+
+import pytest
+
+import generate_site
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch):
+    """Build into tmp_path with an empty fragment store"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(generate_site, "FRAGMENT_STORE", generate_site.FragmentStore(tmp_path / "store", 2**30))
+    return tmp_path
+
+
+def test_compressed_variants_follow_their_output(scratch):
+    generate_site.build(minify=True, compress=True)
+    assert Path("index.html.gz").exists()
+    # A later build without --compress changes the pages; no old variant may survive
+    generate_site.build()
+    for variant in scratch.rglob("*.gz"):
+        assert gzip.decompress(variant.read_bytes()) == Path(str(variant)[:-3]).read_bytes(), variant
+    assert not Path("index.html.gz").exists()
+    generate_site.build(compress=True)
+    assert gzip.decompress(Path("index.html.gz").read_bytes()) == Path("index.html").read_bytes()
+
+
+def test_pooled_build_reports_speedup_over_last_serial_build(scratch, capsys):
+    generate_site.build(jobs=2)
+    assert "build once with --jobs 1" in capsys.readouterr().out
+    generate_site.build(force=True)
+    manifest = generate_site.load_manifest()
+    assert all(entry["serial_seconds"] > 0 for entry in manifest.values())
+    # force re-renders everything but keeps the serial times to compare with
+    generate_site.build(jobs=2, force=True)
+    assert "x (" in capsys.readouterr().out.split("Speedup: ")[1]
+    assert generate_site.load_manifest()["index.html"]["serial_seconds"] == manifest["index.html"]["serial_seconds"]
@@ -0,0 +1,126 @@
+"""Content loading, validation and the resume section built from it"""
+
+import copy
+import json
+import os
+from pathlib import Path
+
+from fasthtml.common import *
+import pytest
+
+import generate_site
+from generate_site import ContentError
+
+
+@pytest.fixture
+def raw():
+    """The content file as plain data"""
+    with open(generate_site.CONTENT_SOURCES[0], encoding="utf-8") as f:
+        return json.load(f)
+
+
+def use(monkeypatch, raw):
+    monkeypatch.setattr(generate_site, "CONTENT", generate_site.content_records(generate_site.validate_content(raw)))
+
+
+def test_shared_bullet_edit_reaches_site_and_resume(monkeypatch, raw):
+    job = raw["experience"][0]
+    shared = job["bullets"][3]
+    assert "resume" in job and shared not in json.dumps(job["resume"])
+    job["bullets"][3] = shared.replace("4-person", "5-person")
+    use(monkeypatch, raw)
+    resume = generate_site.create_resume_experience()
+    card = to_xml(generate_site.create_job_card(generate_site.CONTENT["experience"][0]))
+    assert "5-person" in resume and "5-person" in card
+    assert "4-person" not in resume
+
+
+def test_resume_overrides(monkeypatch, raw):
+    raw["experience"] = [{
+        "company": "Site Co", "title": "Engineer", "date": "2020",
+        "bullets": ["Kept as is", "Extended", "Replaced", "Listed"],
+        "resume": {"company": "Resume Co", "bullets": [
+            {}, {"suffix": " (more)"}, {"text": "Reworded"}, {"suffix": ":", "items": ["one", "two"]},
+        ]},
+    }, {"company": "Other", "title": "Writer", "date": "2019", "description": "Wrote things"}]
+    use(monkeypatch, raw)
+    resume = generate_site.create_resume_experience()
+    assert "{Resume Co -- Engineer}{2020}" in resume
+    for line in ("\\resumeItem{Kept as is}", "\\resumeItem{Extended (more)}", "\\resumeItem{Reworded}",
+                 "\\resumeItem{Listed:", "      \\item one", "\\resumeItem{Wrote things}"):
+        assert line in resume, line
+    assert "Replaced" not in resume
+
+
+def test_more_resume_bullets_than_site_bullets_is_an_error(raw):
+    job = raw["experience"][2]
+    job["resume"] = {"bullets": [{}] * (len(job["bullets"]) + 1)}
+    with pytest.raises(ContentError, match=r"experience\[2\]\.resume\.bullets"):
+        generate_site.validate_content(raw)
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch, raw):
+    """A content file in tmp_path, its cache in tmp_path/cache, and the parses load_content does"""
+    monkeypatch.setattr(generate_site, "CONTENT_CACHE_DIR", tmp_path / "cache")
+    parses = []
+    parse = generate_site._parse_content
+    monkeypatch.setattr(generate_site, "_parse_content", lambda path, data: parses.append(path) or parse(path, data))
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    return path, parses
+
+
+def test_cache_is_next_to_the_script():
+    assert generate_site.CONTENT_CACHE_DIR == Path(generate_site.__file__).resolve().with_name(".cache")
+
+
+def test_schema_errors_are_listed(tmp_path, monkeypatch, raw):
+    monkeypatch.setattr(generate_site, "CONTENT_CACHE_DIR", tmp_path / "cache")
+    del raw["about"]["title"]
+    raw["experience"][0]["date"] = 2020
+    raw["extra"] = True
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    with pytest.raises(ContentError) as excinfo:
+        generate_site.load_content(path)
+    assert str(excinfo.value).splitlines() == [
+        "content.about: missing 'title'",
+        "content.experience[0].date: expected str, got int",
+        "content: unknown key 'extra'",
+    ]
+    path.write_text("{", encoding="utf-8")
+    with pytest.raises(ContentError, match="content.json"):
+        generate_site.load_content(path)
+    assert not list((tmp_path / "cache").glob("*"))
+
+
+def test_unchanged_file_is_not_parsed_again(loader):
+    path, parses = loader
+    first = generate_site.load_content(path)
+    assert generate_site.load_content(path) == first
+    # Same bytes with a new mtime: hashed, still not parsed
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert generate_site.load_content(path) == first
+    assert len(parses) == 1
+
+
+def test_edited_file_is_parsed_again(loader, raw):
+    path, parses = loader
+    generate_site.load_content(path)
+    raw["about"]["title"] = "Edited"
+    path.write_text(json.dumps(raw), encoding="utf-8")
+    assert generate_site.load_content(path)["about"].title == "Edited"
+    assert len(parses) == 2
+
+
+def test_schema_change_invalidates_the_cache(loader, monkeypatch):
+    path, parses = loader
+    generate_site.load_content(path)
+    schema = copy.deepcopy(generate_site.CONTENT_SCHEMA)
+    schema["about"]["subtitle?"] = str
+    monkeypatch.setattr(generate_site, "CONTENT_SCHEMA", schema)
+    generate_site.load_content(path)
+    generate_site.load_content(path)
+    assert len(parses) == 2
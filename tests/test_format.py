@@ -0,0 +1,126 @@
+"""The markup scanner behind format_text: pairing, nesting and what stays plain text"""
+
+from fasthtml.common import Div, to_xml
+import pytest
+
+import generate_site
+from generate_site import LRUCache, Run, format_many, format_text, parse_many, parse_markup
+
+
+def italic(*children):
+    return Run("italic", children)
+
+
+def bold(*children):
+    return Run("bold", children)
+
+
+def underline(*children):
+    return Run("underline", children)
+
+
+@pytest.mark.parametrize("text, parts", [
+    ("_word_", (italic("word"),)),
+    ("*word*", (bold("word"),)),
+    ("/word/", (underline("word"),)),
+    ("a _b_ c *d* e", ("a ", italic("b"), " c ", bold("d"), " e")),
+    ("_a_b_", (italic("a"), "b_")),
+])
+def test_single(text, parts):
+    assert parse_markup(text) == parts
+
+
+@pytest.mark.parametrize("text, parts", [
+    ("_*word*_", (italic(bold("word")),)),
+    ("/_*word*_/", (underline(italic(bold("word"))),)),
+    ("_word *bold* word_", (italic("word ", bold("bold"), " word"),)),
+    # Any depth, which the regex (three levels of fixed orders) couldn't do
+    ("_a *b /c/ b* a_", (italic("a ", bold("b ", underline("c"), " b"), " a"),)),
+    ("a _b *c* d_ /e *f _g_ f* e/", ("a ", italic("b ", bold("c"), " d"), " ",
+                                     underline("e ", bold("f ", italic("g"), " f"), " e"))),
+    # A marker closes at its next occurrence, so the same marker doesn't nest in itself
+    ("_a _b_ a_", (italic("a "), "b", italic(" a"))),
+])
+def test_nested(text, parts):
+    assert parse_markup(text) == parts
+
+
+@pytest.mark.parametrize("text, parts", [
+    # The first marker wins; the crossing closer is left as text
+    ("_a *b_ c*", (italic("a *b"), " c*")),
+    ("*a _b* c_", (bold("a _b"), " c_")),
+])
+def test_crossing(text, parts):
+    assert parse_markup(text) == parts
+
+
+@pytest.mark.parametrize("text", ["_", "**", "_a", "a_b", "*a _b c", "/", "//", "a__b"])
+def test_unpaired_and_empty_spans_stay_plain(text):
+    assert "".join(parse_markup(text)) == text
+
+
+def test_non_strings_pass_through():
+    assert parse_markup("") == ()
+    assert parse_markup(None) == ()
+    assert parse_markup(42) == (42,)
+
+
+def test_slashes_in_urls_pair_like_any_marker():
+    # Same as the regex: a URL in running text gets underlined between its
+    # slashes, so links belong in A components, not in formatted paragraphs
+    assert parse_markup("see http://x.com/a") == ("see http:/", underline("x.com"), "a")
+    assert parse_markup("either/or") == ("either/or",)
+    assert parse_markup("and/or, /u/") == ("and", underline("or, "), "u/")
+
+
+def test_format_text_renders_tags():
+    html = to_xml(Div(*format_text("plain _it *bold* it_ /u/")))
+    assert "plain <em>it <strong>bold</strong> it</em> <u>u</u>" in html
+    assert format_text("") == ()
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """A fresh FORMAT_CACHE"""
+    cache = LRUCache(max_entries=64)
+    monkeypatch.setattr(generate_site, "FORMAT_CACHE", cache)
+    return cache
+
+
+def one_by_one(paragraphs, cache):
+    """parse_markup on each paragraph, each parse starting from an empty cache"""
+    results = []
+    for text in paragraphs:
+        cache.clear()
+        results.append(parse_markup(text))
+    cache.clear()
+    return results
+
+
+@pytest.mark.parametrize("paragraphs", [
+    # Markers at the edges of the joined buffer must not pair across paragraphs
+    ["a_", "_b"],
+    ["*x", "y*"],
+    ["/", "/", "_a", "b_ _c_"],
+    ["_a_", "", None, "_a_", "*b*", None, "*b*", ""],
+    ["", None],
+    [],
+])
+def test_parse_many_matches_parse_markup(cache, paragraphs):
+    assert parse_many(paragraphs) == one_by_one(paragraphs, cache)
+
+
+def test_parse_many_mixes_cached_and_uncached(cache):
+    paragraphs = ["_a", "b_", "_c_ *d*", "/e/", "_a", "b_", "f*", "*g"]
+    expected = one_by_one(paragraphs, cache)
+    # Every other paragraph is already cached, including one of each duplicate
+    parse_many(paragraphs[::2])
+    assert parse_many(paragraphs) == expected
+    assert cache.hits == 4
+    # All cached now
+    assert parse_many(paragraphs) == expected
+
+
+def test_format_many_matches_format_text(cache):
+    paragraphs = ["a_", "_b", "_x *y* z_", "", None, "_x *y* z_"]
+    assert format_many(paragraphs) == [format_text(text) for text in paragraphs]
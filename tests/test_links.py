@@ -0,0 +1,160 @@
+"""
+Link checking: the real pages' internal links, and LinkChecker against a
+stub HTTP server on 127.0.0.1, so no network is needed
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+import time
+
+from fasthtml.common import A, Div
+import pytest
+
+import generate_site
+
+
+class StubLinkHandler(BaseHTTPRequestHandler):
+    """
+    Local stand-in for the sites the pages link to: /ok answers 200,
+    /missing 404, /moved redirects to /ok, /get-only refuses HEAD and
+    /slow takes SLOW_SECONDS to answer
+    """
+    protocol_version = "HTTP/1.1"  # keep-alive, so the checker can reuse connections
+    SLOW_SECONDS = 0.2
+    connections = 0
+    arrivals = []
+
+    def setup(self):
+        super().setup()
+        type(self).connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.answer("HEAD")
+
+    def do_GET(self):
+        self.answer("GET")
+
+    def answer(self, method):
+        self.arrivals.append((time.perf_counter(), self.headers["Host"]))
+        path = self.path.partition("?")[0]
+        headers = {}
+        if path == "/slow":
+            time.sleep(self.SLOW_SECONDS)
+            status = 200
+        elif path == "/moved":
+            status, headers = 301, {"Location": "/ok"}
+        elif path == "/get-only":
+            status = 405 if method == "HEAD" else 200
+        else:
+            status = {"/ok": 200}.get(path, 404)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def stub():
+    """Base URL of a fresh stub server"""
+    StubLinkHandler.connections = 0
+    StubLinkHandler.arrivals = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubLinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def checker(tmp_path):
+    """Make LinkCheckers that share a results cache in tmp_path"""
+    def make(**kwargs):
+        return generate_site.LinkChecker(cache_file=tmp_path / "links.json", **{"timeout": 5, **kwargs})
+    return make
+
+
+def test_site_links_resolve():
+    problems, counts = generate_site.check_links()
+    assert problems == []
+    assert counts["internal"] > 0
+    links, ids = generate_site.collect_links(generate_site.generate_page("slate_blue"))
+    tabs = [value for attr, value in links if attr == "data-tab"]
+    assert tabs and all(tab in ids for tab in tabs)
+
+
+def test_broken_anchor_is_reported():
+    page = Div(A("About", href="#about"), A("Gone", href="#gone"), Div(id="about"))
+    links, ids = generate_site.collect_links(page)
+    assert [value for _, value in links if value[1:] not in ids] == ["#gone"]
+
+
+def test_results(stub, checker):
+    urls = [f"{stub}/ok", f"{stub}/missing", f"{stub}/moved", f"{stub}/get-only"]
+    results = checker(host_interval=0).check(urls)
+    assert results == {f"{stub}/ok": None, f"{stub}/missing": "HTTP 404",
+                       f"{stub}/moved": None, f"{stub}/get-only": None}
+
+
+def test_connections_are_reused(stub, checker):
+    link_checker = checker(host_interval=0.02)
+    link_checker.check([f"{stub}/ok?{i}" for i in range(5)])
+    assert link_checker.requests == 5
+    assert StubLinkHandler.connections == link_checker.connections == 1
+
+
+def test_rate_limit_and_overlap(stub, checker):
+    interval, slow = 0.05, 6
+    link_checker = checker(host_interval=interval)
+    start = time.perf_counter()
+    link_checker.check([f"{stub}/slow?{i}" for i in range(slow)])
+    wall = time.perf_counter() - start
+    arrivals = sorted(arrival for arrival, _ in StubLinkHandler.arrivals)
+    # Requests to one host start interval apart, yet the slow answers overlap.
+    # Arrivals are stamped by server threads, so allow one interval of jitter
+    assert arrivals[-1] - arrivals[0] >= (slow - 2) * interval
+    assert wall < slow * StubLinkHandler.SLOW_SECONDS
+
+
+def test_rate_limit_holds_after_waiting_for_a_slot(stub, checker):
+    # localhost is another host to the checker; its slow request holds the only
+    # slot while the 127.0.0.1 requests' turns come up, so they all get the slot
+    # late and back to back, and must still start interval apart
+    interval, count = 0.1, 3
+    urls = [stub.replace("127.0.0.1", "localhost") + "/slow"] + [f"{stub}/ok?{i}" for i in range(count)]
+    assert checker(host_interval=interval, concurrency=1).check(urls) == dict.fromkeys(urls)
+    arrivals = sorted(arrival for arrival, host in StubLinkHandler.arrivals if host.startswith("127.0.0.1"))
+    assert len(arrivals) == count
+    # Arrivals are stamped by server threads, so allow some jitter
+    assert all(later - earlier >= interval * 0.8 for earlier, later in zip(arrivals, arrivals[1:])), arrivals
+
+
+def test_queue_delay_does_not_count_towards_timeout(stub, checker):
+    # The last URL waits 1.8s for its turn at the host, well past the timeout
+    urls = [f"{stub}/ok?{i}" for i in range(10)]
+    assert checker(host_interval=0.2, timeout=1).check(urls) == dict.fromkeys(urls)
+    # Waiting for a free slot doesn't count either
+    urls = [f"{stub}/slow?{i}" for i in range(4)]
+    results = checker(host_interval=0, concurrency=1, timeout=StubLinkHandler.SLOW_SECONDS * 2).check(urls)
+    assert results == dict.fromkeys(urls)
+
+
+def test_slow_answer_times_out(stub, checker):
+    url = f"{stub}/slow"
+    timeout = StubLinkHandler.SLOW_SECONDS / 4
+    assert checker(host_interval=0, timeout=timeout).check([url]) == {url: f"no answer in {timeout}s"}
+
+
+def test_reachable_urls_are_cached(stub, checker):
+    urls = [f"{stub}/ok", f"{stub}/missing"]
+    first = checker(host_interval=0)
+    results = first.check(urls)
+    rerun = checker(host_interval=0)
+    assert rerun.check(urls) == results
+    # The broken URL is asked again; the reachable one comes from the cache
+    assert (rerun.cached, rerun.requests) == (1, 1)
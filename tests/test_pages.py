@@ -0,0 +1,38 @@
+"""Structure of the rendered pages that the client script relies on"""
+
+from fasthtml.common import *
+import pytest
+
+import generate_site
+
+
+def elements(tree):
+    """Every FT element in tree, expanding fragments and lazy children"""
+    stack = [tree]
+    while stack:
+        elm = stack.pop()
+        if isinstance(elm, FT):
+            yield elm
+            stack.extend(elm.children)
+        elif hasattr(elm, "__ft__"):
+            stack.append(elm.__ft__())
+        elif isinstance(elm, (tuple, list, generate_site.LazyChildren)):
+            stack.extend(elm)
+
+
+@pytest.mark.parametrize("locale", generate_site.site_locales())
+def test_every_tab_has_a_pane_in_nerdy_mode(locale):
+    page = {elm.attrs["id"]: elm for elm in elements(generate_site.generate_page("slate_blue", locale))
+            if "id" in elm.attrs}
+    nerdy = {elm.attrs["id"] for elm in elements(generate_site.create_nerdy_fragment(locale)) if "id" in elm.attrs}
+    tabs = [elm.attrs["data-tab"] for elm in elements(generate_site.generate_page("slate_blue", locale))
+            if "data-tab" in elm.attrs]
+    assert tabs
+    for tab in tabs:
+        # Nerdy Mode only swaps panes marked nerdy-replaced, for the nerdy- pane tabPane() picks
+        if "nerdy-replaced" in page[tab].attrs.get("class", "").split():
+            assert f"nerdy-{tab}" in nerdy, tab
+    # The academia tab keeps its cards in Nerdy Mode
+    assert "nerdy-replaced" not in page["tab-academia"].attrs["class"]
+    assert "nerdy-tab-academia" not in nerdy
+    assert ":scope > .nerdy-replaced" in generate_site.SITE_JS
@@ -0,0 +1,57 @@
+"""ThemeTemplate against plain $slot substitution, and theme validation"""
+
+import re
+
+import pytest
+
+import generate_site
+from generate_site import ThemeError, ThemeTemplate
+
+
+def substitute(template, theme):
+    return re.sub(r"\$(\w+)", lambda m: theme[m.group(1)], template)
+
+
+@pytest.mark.parametrize("theme_key", list(generate_site.THEMES))
+def test_renders_every_theme(theme_key):
+    theme = generate_site.THEMES[theme_key]
+    assert generate_site.THEME_STYLE.render(theme) == substitute(generate_site.THEME_TEMPLATE, theme)
+
+
+@pytest.mark.parametrize("template", [
+    "",
+    ":root { color: red; }",
+    "$only",
+    "a { width: 50%; content: '\\\\'; } $x$y {$z}",
+    '"quoted" \'text\'\n$x\n',
+])
+def test_renders_any_template(template):
+    theme = {"only": "1", "x": "2", "y": "3", "z": "%s {}"}
+    assert ThemeTemplate(template).render(theme) == substitute(template, theme)
+
+
+def test_required_keys():
+    assert ThemeTemplate("$a $b $a").required == {"name", "a", "b"}
+    assert ThemeTemplate("no slots").required == {"name"}
+
+
+def test_missing_key_raises():
+    with pytest.raises(KeyError):
+        ThemeTemplate("$a").render({})
+
+
+def test_validation_lists_every_problem():
+    themes = {"ok": generate_site.THEMES["slate_blue"], "bad": {"name": 1}}
+    with pytest.raises(ThemeError) as excinfo:
+        generate_site.validate_themes(themes)
+    message = str(excinfo.value)
+    assert "themes.bad: missing" in message and "themes.bad.name: expected str, got int" in message
+    assert "themes.ok" not in message
+
+
+def test_build_validates_themes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setitem(generate_site.THEMES, "bad", {"name": "Bad"})
+    with pytest.raises(ThemeError, match="themes.bad: missing"):
+        generate_site.build()
+    assert not list(tmp_path.iterdir())
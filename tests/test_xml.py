@@ -0,0 +1,86 @@
+"""iter_xml and write_page against fastcore's to_xml, and streaming memory"""
+
+import io
+import json
+import tracemalloc
+
+from fasthtml.common import *
+import pytest
+
+import generate_site
+from generate_site import iter_xml
+
+
+@pytest.fixture(autouse=True)
+def scratch_store(tmp_path, monkeypatch):
+    """Render into an empty fragment store instead of ./.cache"""
+    monkeypatch.setattr(generate_site, "FRAGMENT_STORE", generate_site.FragmentStore(tmp_path, 2**30))
+    generate_site.FRAGMENT_CACHE.clear()
+    yield
+    generate_site.FRAGMENT_CACHE.clear()
+
+
+@pytest.mark.parametrize("tree", [
+    None,
+    Safe("<b>already markup</b>"),
+    P("one text child"),
+    Div(P("a < b"), "between & after", Span("b"), None, 42, (Em("c"), (Strong("d"),))),
+    Div(Br(), Img(src="x.png", alt=""), Hr()),
+    Div(P("kept"), hidden=False, title=None, data_x="1", cls="a b", _="raw"),
+    Pre(Code(Span("keep"), "  spacing  ")),
+    Textarea(Span("x"), "y"),
+    Div(Div(P("edit"), contenteditable="true"), P("after")),
+    Script("if (a < b && c) {}"),
+    Span(Span(Span("inline"), Div("block inside inline"))),
+    Html(Head(Title("t"), Style("p { color: red }")), Body(Main(Section(H2("h"), P("p"))))),
+])
+@pytest.mark.parametrize("indent", [True, False])
+def test_matches_to_xml(tree, indent):
+    assert "".join(iter_xml(tree, indent=indent)) == to_xml(tree, indent=indent)
+
+
+@pytest.mark.parametrize("locale", generate_site.site_locales())
+@pytest.mark.parametrize("theme_key", list(generate_site.THEMES))
+def test_pages_match_to_xml(theme_key, locale):
+    page = f"<!DOCTYPE html>\n{to_xml(generate_site.generate_page(theme_key, locale))}".encode("utf-8")
+    generate_site.FRAGMENT_CACHE.clear()
+    assert generate_site.render_page(theme_key, locale) == page
+    # Again with the fragments spliced in from the cache and the store
+    assert generate_site.render_page(theme_key, locale) == page
+    f = io.BytesIO()
+    assert generate_site.write_page(theme_key, f, locale) == len(page)
+    assert f.getvalue() == page
+
+
+def test_nerdy_fragment_matches_to_xml():
+    fragment = generate_site.create_nerdy_fragment()
+    assert "".join(iter_xml(fragment)) == to_xml(fragment)
+
+
+def stream_peak(monkeypatch, entries):
+    experience = generate_site.CONTENT["experience"]
+    monkeypatch.setitem(generate_site.CONTENT, "experience",
+                        [experience[i % len(experience)] for i in range(entries)])
+    generate_site.FRAGMENT_CACHE.clear()
+    with open(os.devnull, "wb") as f:
+        tracemalloc.start()
+        try:
+            generate_site.write_page("slate_blue", f)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def test_streaming_memory_is_flat(monkeypatch):
+    # The first large page makes some one-off allocations; measure after it
+    stream_peak(monkeypatch, 2_000)
+    small = stream_peak(monkeypatch, 10)
+    assert stream_peak(monkeypatch, 10_000) < 2 * small
+
+
+@pytest.mark.parametrize("locale", generate_site.site_locales())
+def test_nerdy_script_carries_the_fragment(locale):
+    script = generate_site.render_nerdy_script(locale).decode("utf-8")
+    assignment, _, value = script.partition(" = ")
+    assert assignment == "window.nerdyFragment"
+    assert json.loads(value.rstrip().removesuffix(";")) == generate_site.render_nerdy_fragment(locale).decode("utf-8")